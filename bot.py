@@ -31,9 +31,18 @@ from telegram.ext import (
     MessageHandler,
     filters,
 )
+from telegram.request import HTTPXRequest
+
+# orjson is optional - a C-backed JSON parser several times faster than the
+# standard library. If it's not installed, the bot works fine without it.
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Import our modules
-from config import TELEGRAM_BOT_TOKEN, ALLOWED_USER_ID
+from config import settings
 from database.connection import init_database
 from handlers.message_handler import (
     handle_message,
@@ -55,6 +64,54 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+class _FastJSONRequest(HTTPXRequest):
+    """
+    HTTPXRequest that decodes Telegram's responses with orjson.
+
+    LEARNING MOMENT: JSON Decode Cost
+    Every getUpdates response is a JSON blob that must be parsed before the
+    bot can do anything with it. With a 30-second long poll, those blobs can
+    batch up several updates at once, and stdlib json parses them in pure
+    Python. orjson does the same work in native code, 3-5x faster, and takes
+    the raw bytes directly (no separate UTF-8 decode step). PTB explicitly
+    documents parse_json_payload as the override point for this.
+    """
+
+    @staticmethod
+    def parse_json_payload(payload: bytes) -> dict:
+        if ORJSON_AVAILABLE:
+            try:
+                return orjson.loads(payload)
+            except orjson.JSONDecodeError:
+                pass  # fall through to PTB's parser and its error handling
+        return HTTPXRequest.parse_json_payload(payload)
+
+
+# Command dispatch table. One CommandHandler covers all of these, so PTB
+# checks a single handler per update instead of walking six, and adding a
+# new command is one line here instead of another add_handler block.
+CMDS = {
+    "start": handle_start_command,
+    "help": handle_help_command,
+    "status": handle_status_command,
+    "positions": handle_positions_command,
+    "log": handle_log_command,
+    "balance": handle_balance_command,  # alias for /positions
+}
+
+
+async def _dispatch_command(update: Update, context) -> None:
+    """Look up the command in CMDS and run its handler.
+
+    "/log 2024" -> "log", "/status@MyBot" -> "status" (the @botname suffix
+    appears in group chats).
+    """
+    command = update.message.text.split()[0][1:].split("@")[0].lower()
+    handler = CMDS.get(command)
+    if handler:
+        await handler(update, context)
+
+
 def create_user_filter():
     """
     Create a filter to restrict bot access to specific users.
@@ -62,8 +119,8 @@ def create_user_filter():
     If ALLOWED_USER_ID is set, only that user can use the bot.
     Otherwise, anyone can use it.
     """
-    if ALLOWED_USER_ID:
-        return filters.User(user_id=ALLOWED_USER_ID)
+    if settings.allowed_user_id:
+        return filters.User(user_id=settings.allowed_user_id)
     return filters.ALL
 
 
@@ -116,8 +173,27 @@ def main() -> None:
     init_database()
 
     # Step 2: Create the Telegram application
+    # concurrent_updates(True) runs each update as its own task, so a slow
+    # DEX Screener or Claude call in one chat can't stall /status in another.
+    # Ordering within a single chat is preserved by the per-chat lock in
+    # handle_message.
     logger.info("Creating Telegram bot...")
-    application = Application.builder().token(TELEGRAM_BOT_TOKEN).build()
+    #
+    # LEARNING MOMENT: Connection Reuse
+    # Every HTTPS request normally pays a TCP + TLS handshake (a couple of
+    # round-trips) before any data moves. A long-lived pooled client keeps
+    # connections open between calls, and HTTP/2 multiplexes several
+    # in-flight requests over one of them. We configure two clients: one
+    # dedicated to the long-polling getUpdates loop (so a slow poll never
+    # starves a reply), and one pool for everything the bot sends back.
+    application = (
+        Application.builder()
+        .token(settings.telegram_bot_token)
+        .concurrent_updates(True)
+        .request(_FastJSONRequest(connection_pool_size=16, http_version="2"))
+        .get_updates_request(_FastJSONRequest(connection_pool_size=1, http_version="2"))
+        .build()
+    )
 
     # Step 2.5: Register commands with Telegram (for the dropdown menu)
     application.post_init = set_bot_commands
@@ -126,25 +202,10 @@ def main() -> None:
     user_filter = create_user_filter()
 
     # Step 4: Register command handlers
-    # These respond to /command messages
-    application.add_handler(
-        CommandHandler("start", handle_start_command, filters=user_filter)
-    )
+    # One handler matches every command in CMDS; _dispatch_command routes
+    # to the right function with a dict lookup
     application.add_handler(
-        CommandHandler("help", handle_help_command, filters=user_filter)
-    )
-    application.add_handler(
-        CommandHandler("status", handle_status_command, filters=user_filter)
-    )
-    application.add_handler(
-        CommandHandler("positions", handle_positions_command, filters=user_filter)
-    )
-    application.add_handler(
-        CommandHandler("log", handle_log_command, filters=user_filter)
-    )
-    # Keep /balance as alias for /positions
-    application.add_handler(
-        CommandHandler("balance", handle_balance_command, filters=user_filter)
+        CommandHandler(list(CMDS), _dispatch_command, filters=user_filter)
     )
 
     # Step 5: Register message handler
@@ -162,14 +223,26 @@ def main() -> None:
 
     # Step 7: Start the bot!
     logger.info("Starting bot... Press Ctrl+C to stop.")
-    if ALLOWED_USER_ID:
-        logger.info(f"Bot restricted to user ID: {ALLOWED_USER_ID}")
+    if settings.allowed_user_id:
+        logger.info(f"Bot restricted to user ID: {settings.allowed_user_id}")
     else:
         logger.info("Bot is open to all users")
 
     # Run the bot until Ctrl+C is pressed
     # This uses "polling" - the bot repeatedly asks Telegram for new messages
-    application.run_polling(allowed_updates=Update.ALL_TYPES)
+    #
+    # LEARNING MOMENT: Long Polling
+    # timeout=30 tells Telegram to hold each getUpdates request open for up
+    # to 30 seconds until something arrives, and poll_interval=0.0 re-polls
+    # immediately after - one mostly-idle connection instead of a rapid
+    # request loop. We also only subscribe to "message" updates: this bot
+    # handles nothing else, so there's no point receiving (and JSON-decoding)
+    # channel posts, membership changes, and the rest.
+    application.run_polling(
+        poll_interval=0.0,
+        timeout=30,
+        allowed_updates=[Update.MESSAGE],
+    )
 
 
 # This block runs only when you execute: python bot.py
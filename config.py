@@ -20,6 +20,9 @@ for this specific project without affecting your whole system.
 """
 
 import os
+from dataclasses import dataclass
+from typing import Optional
+
 from dotenv import load_dotenv
 
 # Load .env file into environment variables
@@ -41,26 +44,46 @@ def get_required_env(key: str) -> str:
     return value
 
 
-# Required settings
-TELEGRAM_BOT_TOKEN = get_required_env("TELEGRAM_BOT_TOKEN")
+# LEARNING MOMENT: Frozen Config
+# All settings are read from the environment exactly once, at import time,
+# into one immutable object. frozen=True means nothing can accidentally
+# reassign a setting at runtime, and slots=True makes attribute access a
+# fixed-offset lookup instead of a dict lookup.
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Everything the bot needs from the environment, parsed once."""
+    # Required: your Telegram bot token from BotFather
+    telegram_bot_token: str
+
+    # If set, only that user can use the bot; None means open to anyone
+    allowed_user_id: Optional[int]
+
+    # Database file location (relative to project root)
+    database_path: str
+
+    # DEX Screener API (no auth needed, but we define the base URL here)
+    dexscreener_api_base: str
+
+    # Anthropic API Key (for Claude-powered message parsing)
+    # Optional - if not set, falls back to regex parsing
+    anthropic_api_key: Optional[str]
 
-# Optional settings (with defaults)
-# If you set ALLOWED_USER_ID, only that user can use the bot
-# Leave it unset (or empty) to allow anyone
-ALLOWED_USER_ID = os.getenv("ALLOWED_USER_ID")
-if ALLOWED_USER_ID:
-    ALLOWED_USER_ID = int(ALLOWED_USER_ID)
+    # Environment indicator (set to "railway" on Railway, "digitalocean" on DO)
+    # Used by /status command to show where the bot is running
+    environment: str
 
-# Database file location (relative to project root)
-DATABASE_PATH = os.getenv("DATABASE_PATH", "trades.db")
 
-# DEX Screener API (no auth needed, but we define the base URL here)
-DEXSCREENER_API_BASE = "https://api.dexscreener.com"
+def _load_settings() -> Settings:
+    """Build the one Settings instance from the environment."""
+    allowed_user_id = os.getenv("ALLOWED_USER_ID")
+    return Settings(
+        telegram_bot_token=get_required_env("TELEGRAM_BOT_TOKEN"),
+        allowed_user_id=int(allowed_user_id) if allowed_user_id else None,
+        database_path=os.getenv("DATABASE_PATH", "trades.db"),
+        dexscreener_api_base="https://api.dexscreener.com",
+        anthropic_api_key=os.getenv("ANTHROPIC_API_KEY"),
+        environment=os.getenv("ENVIRONMENT", "local"),
+    )
 
-# Anthropic API Key (for Claude-powered message parsing)
-# Optional - if not set, falls back to regex parsing
-ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY")
 
-# Environment indicator (set to "railway" on Railway, "digitalocean" on DO)
-# Used by /status command to show where the bot is running
-ENVIRONMENT = os.getenv("ENVIRONMENT", "local")
+settings = _load_settings()
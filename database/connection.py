@@ -13,27 +13,41 @@ lives in one file (trades.db). This makes it perfect for small projects.
 The trade-off: Only one program can write at a time. For a personal trade
 journal, this is fine. For a website with 1000 users, you'd need PostgreSQL.
 
-LEARNING MOMENT: Context Managers (the 'with' statement)
-When you see 'with get_connection() as conn:', Python automatically:
-1. Opens the connection
-2. Runs your code
-3. Closes the connection (even if there's an error)
-This prevents "connection leaks" where you forget to close connections.
+LEARNING MOMENT: Connection Caching
+Opening a SQLite connection isn't free: it's a file open plus a PRAGMA
+round-trip every time. Instead of reconnecting for every query, we open one
+connection per thread and reuse it. The connection is stored in a
+threading.local() so each thread gets its own (sqlite3 connections aren't
+safe to share across threads without care).
+
+Together with asyncio.to_thread in the handlers, this IS our connection
+pool: to_thread runs on a bounded worker-thread pool, and each of those
+threads holds exactly one cached connection, opened once. Client/server
+databases need explicit pool objects because connects cross the network;
+for an embedded file, per-thread caching gives the same amortization.
 """
 
 import sqlite3
+import threading
 from pathlib import Path
 
 # Import the database path from config
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from config import DATABASE_PATH
+from config import settings
+
+DATABASE_PATH = settings.database_path
+
+
+# Per-thread connection cache. Each thread opens the database once and
+# reuses that connection for every query afterwards.
+_local = threading.local()
 
 
 def get_connection() -> sqlite3.Connection:
     """
-    Get a connection to the SQLite database.
-    Creates the database file if it doesn't exist.
+    Get the cached connection to the SQLite database for this thread.
+    Opens it (creating the database file if needed) on first use.
 
     Returns:
         sqlite3.Connection: A connection object you can use to query the database
@@ -43,37 +57,194 @@ def get_connection() -> sqlite3.Connection:
             cursor = conn.execute("SELECT * FROM trades")
             trades = cursor.fetchall()
     """
+    conn = getattr(_local, "conn", None)
+    if conn is not None:
+        return conn
+
     # Connect to the database (creates file if it doesn't exist)
-    conn = sqlite3.connect(DATABASE_PATH)
+    # isolation_level=None puts sqlite3 in autocommit mode, so we don't
+    # need a conn.commit() after every statement
+    # cached_statements widens sqlite3's internal prepared-statement cache
+    # so repeated queries skip the SQL parse/plan step
+    conn = sqlite3.connect(
+        DATABASE_PATH,
+        check_same_thread=False,
+        isolation_level=None,
+        cached_statements=256,
+    )
 
     # Return rows as dictionaries instead of tuples
     # This lets you access columns by name: row['symbol'] instead of row[0]
     conn.row_factory = sqlite3.Row
 
-    # Enable foreign key enforcement
+    # Enable foreign key enforcement (once per connection, not per query)
     conn.execute("PRAGMA foreign_keys = ON")
 
+    # Performance pragmas. These are per-connection (unlike journal_mode=WAL,
+    # which is set once per database file in init_database):
+    # - synchronous=NORMAL: safe with WAL, skips an fsync per transaction
+    # - temp_store=MEMORY: temp tables/indexes stay in RAM
+    # - mmap_size: read pages via memory-mapped IO instead of read() calls
+    # - cache_size: negative = size in KiB, so -65536 = 64 MB page cache
+    # - busy_timeout: wait instead of erroring if another writer has the lock
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA mmap_size = 268435456")
+    conn.execute("PRAGMA cache_size = -65536")
+    conn.execute("PRAGMA busy_timeout = 5000")
+
+    _local.conn = conn
     return conn
 
 
+# Bump this whenever schema.sql changes. init_database() compares it
+# against PRAGMA user_version and only replays the schema when needed.
+# Version history:
+#   1 - original tables + indexes
+#   2 - denormalized token info on positions, UPSERT indexes, sync trigger
+#   3 - COLLATE NOCASE on symbol/address columns (replaces LOWER() queries)
+#   4 - covering index for the stats SUM over buys
+#   5 - token_prices table for SQL-side unrealized PnL
+#   6 - precomputed is_perp flag on positions
+#   7 - cached avg_cost_usd column on positions
+CURRENT_SCHEMA_VERSION = 7
+
+# Tables whose text columns carry COLLATE NOCASE as of schema version 3.
+# SQLite can't change a column's collation with ALTER TABLE, so databases
+# created before v3 get these tables rebuilt (rename, recreate, copy back).
+_NOCASE_TABLES = ("wallets", "tokens", "positions")
+
+
 def init_database():
     """
     Initialize the database by running the schema.sql file.
     Creates all tables if they don't exist.
 
     Call this once when the bot starts to ensure tables exist.
+
+    LEARNING MOMENT: Schema Versioning
+    SQLite stores a free integer per database file (PRAGMA user_version).
+    We stamp it after applying the schema, so restarts on an up-to-date
+    database skip the schema.sql read and the parse of every
+    CREATE TABLE IF NOT EXISTS statement entirely.
     """
-    # Find the schema.sql file (same directory as this file)
-    schema_path = Path(__file__).parent / "schema.sql"
+    with get_connection() as conn:
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version >= CURRENT_SCHEMA_VERSION:
+            return
 
-    # Read the SQL commands
-    with open(schema_path, "r") as f:
-        schema_sql = f.read()
+        # Find and read the schema.sql file (same directory as this file).
+        # Only loaded when the schema actually needs applying.
+        schema_path = Path(__file__).parent / "schema.sql"
+        with open(schema_path, "r") as f:
+            schema_sql = f.read()
+
+        # Migrate databases created before the COLLATE NOCASE columns.
+        # ALTER TABLE can't change a column's collation, so old tables are
+        # renamed aside, schema.sql recreates them fresh (which also adds
+        # the denormalized position columns for pre-v2 files), and the data
+        # is copied back. Foreign keys are off so the renames/drops don't
+        # trip the references between these tables.
+        conn.execute("PRAGMA foreign_keys = OFF")
+        # legacy_alter_table stops RENAME from rewriting REFERENCES clauses
+        # in other tables - trades should keep pointing at "tokens", not at
+        # the doomed "tokens_old".
+        conn.execute("PRAGMA legacy_alter_table = ON")
+        rebuilt = []
+        for table in _NOCASE_TABLES:
+            row = conn.execute(
+                "SELECT sql FROM sqlite_master WHERE type='table' AND name=?",
+                (table,),
+            ).fetchone()
+            if row and "COLLATE NOCASE" not in row[0]:
+                conn.execute(f"ALTER TABLE {table} RENAME TO {table}_old")
+                rebuilt.append(table)
+        conn.execute("PRAGMA legacy_alter_table = OFF")
+
+        # The sync trigger follows a renamed table and would be dropped with
+        # it, but its name blocks the CREATE TRIGGER IF NOT EXISTS below.
+        if rebuilt:
+            conn.execute("DROP TRIGGER IF EXISTS tokens_position_sync")
 
-    # Execute all the CREATE TABLE statements
-    with get_connection() as conn:
         conn.executescript(schema_sql)
-        conn.commit()
+
+        # schema.sql re-enables foreign keys; keep them off until the _old
+        # tables are gone.
+        conn.execute("PRAGMA foreign_keys = OFF")
+
+        # Copy the saved rows into the rebuilt tables. Old files may lack
+        # columns that exist now, so copy only the columns both versions
+        # share. ids come along, so nothing referencing them breaks.
+        for table in rebuilt:
+            old_cols = {r[1] for r in conn.execute(f"PRAGMA table_info({table}_old)")}
+            shared = ", ".join(
+                r[1] for r in conn.execute(f"PRAGMA table_info({table})")
+                if r[1] in old_cols
+            )
+            conn.execute(
+                f"INSERT OR IGNORE INTO {table} ({shared}) "
+                f"SELECT {shared} FROM {table}_old"
+            )
+            conn.execute(f"DROP TABLE {table}_old")
+        conn.execute("PRAGMA foreign_keys = ON")
+
+        # Backfill denormalized columns for any rows that predate them
+        conn.execute(
+            """
+            UPDATE positions SET
+                symbol = (SELECT symbol FROM tokens WHERE tokens.id = positions.token_id),
+                chain = (SELECT chain FROM tokens WHERE tokens.id = positions.token_id),
+                contract_address = (SELECT contract_address FROM tokens
+                                    WHERE tokens.id = positions.token_id)
+            WHERE contract_address IS NULL
+            """
+        )
+
+        # Databases from before schema v6 lack the is_perp column entirely
+        # (the rebuild above only recreates pre-v3 tables)
+        if "is_perp" not in {
+            row[1] for row in conn.execute("PRAGMA table_info(positions)")
+        }:
+            conn.execute("ALTER TABLE positions ADD COLUMN is_perp INTEGER DEFAULT 0")
+
+        # Backfill is_perp with the rule the handlers used to apply per
+        # render: synthetic addresses contain '_' and aren't hex
+        conn.execute(
+            """
+            UPDATE positions SET is_perp = (
+                instr(contract_address, '_') > 0
+                AND contract_address NOT LIKE '0x%'
+            )
+            WHERE contract_address IS NOT NULL
+            """
+        )
+
+        # Databases from before schema v7 lack the cached average-cost
+        # column; add it, then backfill from the existing totals.
+        # NULLIF turns a zero total_bought into NULL so the division
+        # can't blow up on never-bought positions.
+        if "avg_cost_usd" not in {
+            row[1] for row in conn.execute("PRAGMA table_info(positions)")
+        }:
+            conn.execute("ALTER TABLE positions ADD COLUMN avg_cost_usd REAL")
+        conn.execute(
+            """
+            UPDATE positions
+            SET avg_cost_usd = total_cost_usd / NULLIF(total_bought, 0)
+            WHERE avg_cost_usd IS NULL
+            """
+        )
+
+        # LEARNING MOMENT: WAL (Write-Ahead Logging)
+        # SQLite's default journal mode fsyncs the database file on every
+        # commit, which caps writes at a few hundred per second. WAL appends
+        # changes to a separate log instead, so commits are much cheaper and
+        # readers never block writers. journal_mode is persistent - setting
+        # it once here applies to every future connection to this file.
+        conn.execute("PRAGMA journal_mode = WAL")
+
+        # Stamp the version so the next startup can skip all of the above
+        conn.execute(f"PRAGMA user_version = {CURRENT_SCHEMA_VERSION}")
 
     print(f"Database initialized at: {DATABASE_PATH}")
 
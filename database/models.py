@@ -18,7 +18,7 @@ Never put user input directly into SQL strings! Always use parameterized queries
 The ? placeholder safely escapes special characters.
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator
 from datetime import datetime
 import sqlite3
 
@@ -29,6 +29,18 @@ from .connection import get_connection
 # TOKEN OPERATIONS
 # =============================================================================
 
+# One copy of the UPSERT so the single and bulk paths share the exact
+# same SQL text (identical text = prepared-statement cache hit)
+_TOKEN_UPSERT_SQL = """
+    INSERT INTO tokens (contract_address, chain, symbol, name)
+    VALUES (?, ?, ?, ?)
+    ON CONFLICT(contract_address, chain) DO UPDATE SET
+        symbol = COALESCE(excluded.symbol, symbol),
+        name = COALESCE(excluded.name, name)
+    RETURNING id
+"""
+
+
 def get_or_create_token(
     contract_address: str,
     chain: str,
@@ -49,74 +61,82 @@ def get_or_create_token(
 
     Returns:
         The token's database ID
+
+    LEARNING MOMENT: UPSERT
+    Instead of SELECT-then-INSERT-or-UPDATE (2-3 statements), a single
+    "INSERT ... ON CONFLICT DO UPDATE ... RETURNING" does it all in one
+    round-trip. COALESCE(excluded.symbol, symbol) means: keep the new
+    symbol if we got one, otherwise keep what's already stored.
     """
     with get_connection() as conn:
-        # First, try to find existing token
         cursor = conn.execute(
-            """
-            SELECT id FROM tokens
-            WHERE LOWER(contract_address) = LOWER(?) AND chain = ?
-            """,
-            (contract_address, chain)
-        )
-        row = cursor.fetchone()
-
-        if row:
-            token_id = row['id']
-            # Update symbol/name if we have new info
-            if symbol or name:
-                conn.execute(
-                    """
-                    UPDATE tokens
-                    SET symbol = COALESCE(?, symbol),
-                        name = COALESCE(?, name)
-                    WHERE id = ?
-                    """,
-                    (symbol, name, token_id)
-                )
-                conn.commit()
-            return token_id
-
-        # Create new token
-        cursor = conn.execute(
-            """
-            INSERT INTO tokens (contract_address, chain, symbol, name)
-            VALUES (?, ?, ?, ?)
-            """,
+            _TOKEN_UPSERT_SQL,
             (contract_address, chain, symbol, name)
         )
-        conn.commit()
-        return cursor.lastrowid
+        return cursor.fetchone()['id']
 
 
-def get_token_by_id(token_id: int) -> Optional[Dict[str, Any]]:
+def get_or_create_tokens_bulk(rows: List[tuple]) -> Dict[tuple, int]:
+    """
+    Resolve many tokens to ids at once (for multi-trade messages/imports).
+
+    Each row is (contract_address, chain, symbol, name), same as the
+    arguments to get_or_create_token. sqlite3's executemany can't surface
+    RETURNING values, so this loops the same UPSERT - but inside a single
+    transaction, so the whole batch pays one commit instead of one per
+    token.
+
+    Returns:
+        {(contract_address, chain): token_id}
+    """
+    ids: Dict[tuple, int] = {}
+    if not rows:
+        return ids
+
+    conn = get_connection()
+    conn.execute("BEGIN")
+    try:
+        for row in rows:
+            cursor = conn.execute(_TOKEN_UPSERT_SQL, row)
+            ids[(row[0], row[1])] = cursor.fetchone()['id']
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    return ids
+
+
+def get_token_by_id(token_id: int) -> Optional[sqlite3.Row]:
     """Get a token by its database ID."""
-    with get_connection() as conn:
-        cursor = conn.execute(
-            "SELECT * FROM tokens WHERE id = ?",
-            (token_id,)
-        )
-        row = cursor.fetchone()
-        return dict(row) if row else None
+    conn = get_connection()
+    cursor = conn.execute(
+        "SELECT * FROM tokens WHERE id = ?",
+        (token_id,)
+    )
+    return cursor.fetchone()
 
 
-def find_token_by_symbol(symbol: str) -> List[Dict[str, Any]]:
+def find_token_by_symbol(symbol: str) -> List[sqlite3.Row]:
     """
-    Find tokens by symbol (case-insensitive).
+    Find tokens by symbol.
     Returns a list because multiple tokens might have the same symbol.
+
+    No LOWER() needed here: tokens.symbol is COLLATE NOCASE, so plain
+    equality is case-insensitive and can still use the symbol index.
+    (Wrapping a column in a function defeats its index.)
     """
-    with get_connection() as conn:
-        cursor = conn.execute(
-            """
-            SELECT t.*, p.status as position_status
-            FROM tokens t
-            LEFT JOIN positions p ON p.token_id = t.id
-            WHERE LOWER(t.symbol) = LOWER(?)
-            ORDER BY p.status = 'OPEN' DESC, t.created_at DESC
-            """,
-            (symbol,)
-        )
-        return [dict(row) for row in cursor.fetchall()]
+    conn = get_connection()
+    cursor = conn.execute(
+        """
+        SELECT t.*, p.status as position_status
+        FROM tokens t
+        LEFT JOIN positions p ON p.token_id = t.id
+        WHERE t.symbol = ?
+        ORDER BY p.status = 'OPEN' DESC, t.created_at DESC
+        """,
+        (symbol,)
+    )
+    return cursor.fetchall()
 
 
 # =============================================================================
@@ -128,63 +148,118 @@ def get_or_create_wallet(
     chain: str,
     nickname: Optional[str] = None
 ) -> int:
-    """Get an existing wallet or create a new one."""
+    """Get an existing wallet or create a new one (single UPSERT)."""
     with get_connection() as conn:
-        cursor = conn.execute(
-            """
-            SELECT id FROM wallets
-            WHERE LOWER(address) = LOWER(?) AND chain = ?
-            """,
-            (address, chain)
-        )
-        row = cursor.fetchone()
-
-        if row:
-            return row['id']
-
         cursor = conn.execute(
             """
             INSERT INTO wallets (address, chain, nickname)
             VALUES (?, ?, ?)
+            ON CONFLICT(address, chain) DO UPDATE SET
+                nickname = COALESCE(excluded.nickname, nickname)
+            RETURNING id
             """,
             (address, chain, nickname)
         )
-        conn.commit()
-        return cursor.lastrowid
+        return cursor.fetchone()['id']
 
 
-def get_all_wallets() -> List[Dict[str, Any]]:
+def get_all_wallets() -> List[sqlite3.Row]:
     """Get all wallets."""
-    with get_connection() as conn:
-        cursor = conn.execute("SELECT * FROM wallets ORDER BY created_at")
-        return [dict(row) for row in cursor.fetchall()]
+    conn = get_connection()
+    cursor = conn.execute("SELECT * FROM wallets ORDER BY created_at")
+    return cursor.fetchall()
 
 
 # =============================================================================
 # POSITION OPERATIONS
 # =============================================================================
 
+# Shared by the single and bulk insert paths (same SQL text = same
+# cached prepared statement)
+_POSITION_INSERT_SQL = """
+    INSERT INTO positions (
+        token_id, wallet_id, status, opened_at,
+        symbol, chain, contract_address, is_perp
+    )
+    VALUES (?, ?, 'OPEN', CURRENT_TIMESTAMP, ?, ?, ?, ?)
+    RETURNING *
+"""
+
+
+def _is_perp_address(contract_address: Optional[str]) -> bool:
+    """Synthetic perp/CEX addresses look like "BTC_hyperliquid"."""
+    # O(1) prefix check first; the '_' scan only runs for non-hex addresses
+    return bool(
+        contract_address
+        and contract_address[:2] != '0x'
+        and '_' in contract_address
+    )
+
+
 def create_position(
     token_id: int,
-    wallet_id: Optional[int] = None
-) -> int:
-    """Create a new position for a token."""
+    wallet_id: Optional[int] = None,
+    symbol: Optional[str] = None,
+    chain: Optional[str] = None,
+    contract_address: Optional[str] = None
+) -> sqlite3.Row:
+    """
+    Create a new position for a token and return the full new row.
+
+    RETURNING * hands the inserted row straight back, so callers that
+    need it (every trade path does, for the position state) skip the
+    get_position_by_id re-fetch that used to follow this insert.
+
+    symbol/chain/contract_address are denormalized copies of the token's
+    info so list views can read positions without a JOIN. is_perp is
+    computed once here (synthetic addresses like "BTC_hyperliquid") so
+    renders never re-derive it from the address string.
+    """
     with get_connection() as conn:
         cursor = conn.execute(
-            """
-            INSERT INTO positions (token_id, wallet_id, status, opened_at)
-            VALUES (?, ?, 'OPEN', CURRENT_TIMESTAMP)
-            """,
-            (token_id, wallet_id)
+            _POSITION_INSERT_SQL,
+            (token_id, wallet_id, symbol, chain, contract_address,
+             _is_perp_address(contract_address))
         )
-        conn.commit()
-        return cursor.lastrowid
+        return cursor.fetchone()
+
+
+def create_positions_bulk(rows: List[tuple]) -> List[int]:
+    """
+    Create many positions in one transaction.
+
+    Each row is (token_id, symbol, chain, contract_address). Loops the
+    same INSERT as create_position (executemany can't hand back the
+    rowids) but commits once for the batch.
+
+    Returns:
+        New position ids, in input order
+    """
+    if not rows:
+        return []
+
+    ids = []
+    conn = get_connection()
+    conn.execute("BEGIN")
+    try:
+        for token_id, symbol, chain, contract_address in rows:
+            cursor = conn.execute(
+                _POSITION_INSERT_SQL,
+                (token_id, None, symbol, chain, contract_address,
+                 _is_perp_address(contract_address))
+            )
+            ids.append(cursor.fetchone()['id'])
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    return ids
 
 
 def get_open_position(
     token_id: int,
     wallet_id: Optional[int] = None
-) -> Optional[Dict[str, Any]]:
+) -> Optional[sqlite3.Row]:
     """
     Find an open or partial position for a token.
 
@@ -195,48 +270,93 @@ def get_open_position(
     Returns:
         Position dict or None
     """
-    with get_connection() as conn:
-        if wallet_id:
-            cursor = conn.execute(
-                """
-                SELECT * FROM positions
-                WHERE token_id = ? AND wallet_id = ? AND status IN ('OPEN', 'PARTIAL')
-                ORDER BY opened_at DESC
-                LIMIT 1
-                """,
-                (token_id, wallet_id)
-            )
-        else:
-            cursor = conn.execute(
-                """
-                SELECT * FROM positions
-                WHERE token_id = ? AND status IN ('OPEN', 'PARTIAL')
-                ORDER BY opened_at DESC
-                LIMIT 1
-                """,
-                (token_id,)
-            )
-        row = cursor.fetchone()
-        return dict(row) if row else None
+    conn = get_connection()
+    if wallet_id:
+        cursor = conn.execute(
+            """
+            SELECT * FROM positions
+            WHERE token_id = ? AND wallet_id = ? AND status IN ('OPEN', 'PARTIAL')
+            ORDER BY opened_at DESC
+            LIMIT 1
+            """,
+            (token_id, wallet_id)
+        )
+    else:
+        cursor = conn.execute(
+            """
+            SELECT * FROM positions
+            WHERE token_id = ? AND status IN ('OPEN', 'PARTIAL')
+            ORDER BY opened_at DESC
+            LIMIT 1
+            """,
+            (token_id,)
+        )
+    return cursor.fetchone()
 
 
-def get_open_positions_by_symbol(symbol: str) -> List[Dict[str, Any]]:
+def get_open_positions_for_tokens(token_ids: List[int]) -> Dict[int, sqlite3.Row]:
+    """
+    Find open/partial positions for many tokens in one SELECT.
+
+    For each token_id this keeps the most recently opened match - the
+    same row get_open_position would return - so a batch of N trades
+    resolves its positions in one query instead of N.
+
+    Returns:
+        {token_id: position row}
+    """
+    if not token_ids:
+        return {}
+
+    placeholders = ",".join("?" * len(token_ids))
+    conn = get_connection()
+    cursor = conn.execute(
+        f"""
+        SELECT * FROM positions
+        WHERE token_id IN ({placeholders}) AND status IN ('OPEN', 'PARTIAL')
+        ORDER BY opened_at DESC
+        """,
+        token_ids
+    )
+    # Rows arrive newest-first; setdefault keeps the first (= newest) per token
+    positions: Dict[int, sqlite3.Row] = {}
+    for row in cursor:
+        positions.setdefault(row['token_id'], row)
+    return positions
+
+
+def get_open_positions_by_symbol(symbol: str) -> List[sqlite3.Row]:
     """
     Find open positions by token symbol.
     Used when user sells without providing contract address.
     """
-    with get_connection() as conn:
-        cursor = conn.execute(
-            """
-            SELECT p.*, t.symbol, t.name, t.contract_address, t.chain
-            FROM positions p
-            JOIN tokens t ON t.id = p.token_id
-            WHERE LOWER(t.symbol) = LOWER(?) AND p.status IN ('OPEN', 'PARTIAL')
-            ORDER BY p.opened_at DESC
-            """,
-            (symbol,)
-        )
-        return [dict(row) for row in cursor.fetchall()]
+    conn = get_connection()
+    cursor = conn.execute(
+        """
+        SELECT * FROM positions
+        WHERE symbol = ? AND status IN ('OPEN', 'PARTIAL')
+        ORDER BY opened_at DESC
+        """,
+        (symbol,)
+    )
+    return cursor.fetchall()
+
+
+# Shared by update_position and update_positions_bulk
+_POSITION_UPDATE_SQL = """
+    UPDATE positions SET
+        total_bought = COALESCE(?, total_bought),
+        total_sold = COALESCE(?, total_sold),
+        remaining_tokens = COALESCE(?, remaining_tokens),
+        total_cost_usd = COALESCE(?, total_cost_usd),
+        total_proceeds_usd = COALESCE(?, total_proceeds_usd),
+        realized_pnl_usd = COALESCE(?, realized_pnl_usd),
+        avg_cost_usd = COALESCE(?, avg_cost_usd),
+        status = COALESCE(?, status),
+        closed_at = CASE WHEN ? = 'CLOSED'
+                    THEN CURRENT_TIMESTAMP ELSE closed_at END
+    WHERE id = ?
+"""
 
 
 def update_position(
@@ -247,84 +367,176 @@ def update_position(
     total_cost_usd: Optional[float] = None,
     total_proceeds_usd: Optional[float] = None,
     realized_pnl_usd: Optional[float] = None,
+    avg_cost_usd: Optional[float] = None,
     status: Optional[str] = None
 ) -> None:
-    """Update position fields. Only updates fields that are provided."""
-    updates = []
-    params = []
-
-    if total_bought is not None:
-        updates.append("total_bought = ?")
-        params.append(total_bought)
-    if total_sold is not None:
-        updates.append("total_sold = ?")
-        params.append(total_sold)
-    if remaining_tokens is not None:
-        updates.append("remaining_tokens = ?")
-        params.append(remaining_tokens)
-    if total_cost_usd is not None:
-        updates.append("total_cost_usd = ?")
-        params.append(total_cost_usd)
-    if total_proceeds_usd is not None:
-        updates.append("total_proceeds_usd = ?")
-        params.append(total_proceeds_usd)
-    if realized_pnl_usd is not None:
-        updates.append("realized_pnl_usd = ?")
-        params.append(realized_pnl_usd)
-    if status is not None:
-        updates.append("status = ?")
-        params.append(status)
-        if status == 'CLOSED':
-            updates.append("closed_at = CURRENT_TIMESTAMP")
-
-    if not updates:
-        return
-
-    params.append(position_id)
+    """
+    Update position fields. Only updates fields that are provided.
 
+    The statement text is constant: COALESCE(?, col) keeps the existing
+    value when a parameter is None, so every call reuses the same cached
+    prepared statement instead of building SQL strings per call.
+    """
     with get_connection() as conn:
         conn.execute(
-            f"UPDATE positions SET {', '.join(updates)} WHERE id = ?",
-            params
+            _POSITION_UPDATE_SQL,
+            (
+                total_bought, total_sold, remaining_tokens,
+                total_cost_usd, total_proceeds_usd, realized_pnl_usd,
+                avg_cost_usd, status, status, position_id
+            )
         )
-        conn.commit()
 
 
-def get_position_by_id(position_id: int) -> Optional[Dict[str, Any]]:
-    """Get a position by ID with token info."""
-    with get_connection() as conn:
-        cursor = conn.execute(
+def update_positions_bulk(rows: List[tuple]) -> None:
+    """
+    Write final totals for many positions in one executemany.
+
+    Each row is a 10-tuple matching the parameters of _POSITION_UPDATE_SQL:
+    (total_bought, total_sold, remaining_tokens, total_cost_usd,
+     total_proceeds_usd, realized_pnl_usd, avg_cost_usd, status, status,
+     position_id).
+
+    One statement, one transaction, one commit - however many positions
+    a batch of trades touched.
+    """
+    if not rows:
+        return
+
+    conn = get_connection()
+    conn.execute("BEGIN")
+    try:
+        conn.executemany(_POSITION_UPDATE_SQL, rows)
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+
+def get_position_by_id(position_id: int) -> Optional[sqlite3.Row]:
+    """Get a position by ID (token info is denormalized onto the row)."""
+    conn = get_connection()
+    cursor = conn.execute(
+        "SELECT * FROM positions WHERE id = ?",
+        (position_id,)
+    )
+    return cursor.fetchone()
+
+
+def get_all_open_positions() -> List[sqlite3.Row]:
+    """
+    Get all open/partial positions with token info.
+
+    Reads only the positions table - symbol/chain/contract_address are
+    denormalized onto each position row, so no JOIN is needed. The column
+    list names exactly what callers read: sqlite3.Row is already a compact
+    tuple-backed record (no per-row dict), so trimming unused columns is
+    where the remaining per-row cost actually was.
+    """
+    conn = get_connection()
+    cursor = conn.execute(
+        """
+        SELECT symbol, chain, contract_address,
+               remaining_tokens, total_cost_usd, is_perp
+        FROM positions
+        WHERE status IN ('OPEN', 'PARTIAL')
+        ORDER BY opened_at DESC
+        """
+    )
+    return cursor.fetchall()
+
+
+def upsert_token_prices(rows: List[tuple]) -> None:
+    """
+    Store freshly fetched prices, one row per (contract_address, chain).
+
+    Args:
+        rows: Tuples of (contract_address, chain, price_usd)
+    """
+    if not rows:
+        return
+    conn = get_connection()
+    conn.execute("BEGIN")
+    try:
+        conn.executemany(
             """
-            SELECT p.*, t.symbol, t.name, t.contract_address, t.chain
-            FROM positions p
-            JOIN tokens t ON t.id = p.token_id
-            WHERE p.id = ?
+            INSERT INTO token_prices (contract_address, chain, price_usd)
+            VALUES (?, ?, ?)
+            ON CONFLICT(contract_address, chain) DO UPDATE SET
+                price_usd = excluded.price_usd,
+                fetched_at = CURRENT_TIMESTAMP
             """,
-            (position_id,)
+            rows
         )
-        row = cursor.fetchone()
-        return dict(row) if row else None
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
 
 
-def get_all_open_positions() -> List[Dict[str, Any]]:
-    """Get all open/partial positions with token info."""
-    with get_connection() as conn:
-        cursor = conn.execute(
-            """
-            SELECT p.*, t.symbol, t.name, t.contract_address, t.chain
-            FROM positions p
-            JOIN tokens t ON t.id = p.token_id
-            WHERE p.status IN ('OPEN', 'PARTIAL')
-            ORDER BY p.opened_at DESC
-            """
-        )
-        return [dict(row) for row in cursor.fetchall()]
+def get_positions_with_live_pnl() -> List[sqlite3.Row]:
+    """
+    Open positions joined with their last stored price, PnL precomputed.
+
+    LEARNING MOMENT: Push Math Into the Query
+    Instead of loading rows and looping in Python to multiply
+    remaining * price and accumulate totals, the database does all of it
+    in one statement. Each row comes back with current_value_usd,
+    unrealized_pnl_usd and unrealized_pnl_pct filled in, and the
+    SUM(...) OVER () window functions attach the portfolio-wide totals to
+    every row - the handler only formats strings.
+
+    Rows whose token has no stored price have live_price_usd = NULL (and
+    are left out of the value/PnL totals).
+    """
+    conn = get_connection()
+    cursor = conn.execute(
+        """
+        SELECT
+            p.*,
+            tp.price_usd AS live_price_usd,
+            p.remaining_tokens * tp.price_usd AS current_value_usd,
+            p.remaining_tokens * tp.price_usd - p.total_cost_usd
+                AS unrealized_pnl_usd,
+            CASE WHEN p.total_cost_usd > 0 THEN
+                (p.remaining_tokens * tp.price_usd - p.total_cost_usd)
+                    * 100.0 / p.total_cost_usd
+            END AS unrealized_pnl_pct,
+            SUM(p.total_cost_usd) OVER () AS total_invested_usd,
+            SUM(CASE WHEN tp.price_usd IS NOT NULL
+                THEN p.remaining_tokens * tp.price_usd END) OVER ()
+                AS total_current_value_usd,
+            SUM(CASE WHEN tp.price_usd IS NOT NULL
+                THEN p.remaining_tokens * tp.price_usd - p.total_cost_usd
+                END) OVER () AS total_unrealized_pnl_usd,
+            COUNT(tp.price_usd) OVER () AS priced_positions
+        FROM positions p
+        LEFT JOIN token_prices tp
+            ON tp.contract_address = p.contract_address
+            AND tp.chain = p.chain
+        WHERE p.status IN ('OPEN', 'PARTIAL')
+        ORDER BY p.opened_at DESC
+        """
+    )
+    return cursor.fetchall()
 
 
 # =============================================================================
 # TRADE OPERATIONS
 # =============================================================================
 
+# One copy of the INSERT so create_trade and create_trades_bulk share the
+# exact same SQL text (identical text = prepared-statement cache hit)
+_TRADE_INSERT_SQL = """
+    INSERT INTO trades (
+        token_id, trade_type, position_id, wallet_id,
+        amount_spent, spend_currency, amount_tokens,
+        price_usd, total_value_usd, market_cap_at_trade,
+        source_message, notes_url, dex_screener_url, trade_timestamp
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
 def create_trade(
     token_id: int,
     trade_type: str,
@@ -344,14 +556,7 @@ def create_trade(
     """Create a new trade record."""
     with get_connection() as conn:
         cursor = conn.execute(
-            """
-            INSERT INTO trades (
-                token_id, trade_type, position_id, wallet_id,
-                amount_spent, spend_currency, amount_tokens,
-                price_usd, total_value_usd, market_cap_at_trade,
-                source_message, notes_url, dex_screener_url, trade_timestamp
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+            _TRADE_INSERT_SQL,
             (
                 token_id, trade_type, position_id, wallet_id,
                 amount_spent, spend_currency, amount_tokens,
@@ -360,119 +565,179 @@ def create_trade(
                 trade_timestamp or datetime.now()
             )
         )
-        conn.commit()
         return cursor.lastrowid
 
 
-def get_trades_for_position(position_id: int) -> List[Dict[str, Any]]:
-    """Get all trades for a position."""
-    with get_connection() as conn:
-        cursor = conn.execute(
-            """
-            SELECT * FROM trades
-            WHERE position_id = ?
-            ORDER BY trade_timestamp
-            """,
-            (position_id,)
-        )
-        return [dict(row) for row in cursor.fetchall()]
+def create_trades_bulk(rows: List[tuple]) -> int:
+    """
+    Insert many trades at once (for imports/backfills).
 
+    Each row is a 14-tuple matching the columns of _TRADE_INSERT_SQL.
+    executemany inside one explicit transaction amortizes the commit cost
+    across all rows instead of paying it per trade.
 
-def get_recent_trades(limit: int = 10) -> List[Dict[str, Any]]:
-    """Get most recent trades with token info."""
-    with get_connection() as conn:
-        cursor = conn.execute(
-            """
-            SELECT tr.*, t.symbol, t.name, t.chain
-            FROM trades tr
-            JOIN tokens t ON t.id = tr.token_id
-            ORDER BY tr.created_at DESC
-            LIMIT ?
-            """,
-            (limit,)
-        )
-        return [dict(row) for row in cursor.fetchall()]
+    Returns:
+        Number of trades inserted
+    """
+    if not rows:
+        return 0
 
+    conn = get_connection()
+    conn.execute("BEGIN")
+    try:
+        cursor = conn.executemany(_TRADE_INSERT_SQL, rows)
+        conn.execute("COMMIT")
+        return cursor.rowcount
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
 
-def get_all_trades(limit: int = 50) -> List[Dict[str, Any]]:
+
+def get_trades_for_position(position_id: int) -> List[sqlite3.Row]:
+    """Get all trades for a position."""
+    conn = get_connection()
+    cursor = conn.execute(
+        """
+        SELECT * FROM trades
+        WHERE position_id = ?
+        ORDER BY trade_timestamp
+        """,
+        (position_id,)
+    )
+    return cursor.fetchall()
+
+
+def get_recent_trades(limit: int = 10) -> List[sqlite3.Row]:
+    """Get most recent trades with token info."""
+    conn = get_connection()
+    cursor = conn.execute(
+        """
+        SELECT tr.*, t.symbol, t.name, t.chain
+        FROM trades tr
+        JOIN tokens t ON t.id = tr.token_id
+        ORDER BY tr.created_at DESC
+        LIMIT ?
+        """,
+        (limit,)
+    )
+    return cursor.fetchall()
+
+
+def iter_all_trades(limit: int = 50) -> Iterator[sqlite3.Row]:
     """
-    Get all trades with token and position info for the trade log.
+    Stream trades with token and position info, most recent first.
 
-    Returns trades ordered by most recent first.
+    LEARNING MOMENT: Streaming vs fetchall()
+    fetchall() materializes every row in a Python list before returning.
+    Iterating the cursor instead pulls rows from SQLite pages on demand,
+    so memory stays constant no matter how big the result is - and the
+    caller can start formatting the first rows before the scan finishes.
     """
-    with get_connection() as conn:
-        cursor = conn.execute(
-            """
-            SELECT tr.*, t.symbol, t.name, t.chain, t.contract_address,
-                   p.status as position_status
-            FROM trades tr
-            JOIN tokens t ON t.id = tr.token_id
-            LEFT JOIN positions p ON p.id = tr.position_id
-            ORDER BY tr.trade_timestamp DESC
-            LIMIT ?
-            """,
-            (limit,)
-        )
-        return [dict(row) for row in cursor.fetchall()]
+    conn = get_connection()
+    yield from conn.execute(
+        """
+        SELECT tr.*, t.symbol, t.name, t.chain, t.contract_address,
+               p.status as position_status
+        FROM trades tr
+        JOIN tokens t ON t.id = tr.token_id
+        LEFT JOIN positions p ON p.id = tr.position_id
+        ORDER BY tr.trade_timestamp DESC
+        LIMIT ?
+        """,
+        (limit,)
+    )
+
+
+def get_all_trades(limit: int = 50) -> List[sqlite3.Row]:
+    """Get trades as a list (see iter_all_trades for the streaming path)."""
+    return list(iter_all_trades(limit))
+
+
+def iter_all_trades_for_year(year: int) -> Iterator[sqlite3.Row]:
+    """
+    Stream all trades for a specific year (for year-end review).
 
+    Yields rows one at a time - a full year can be thousands of trades,
+    so the caller shouldn't have to hold them all in memory at once.
 
-def get_all_trades_for_year(year: int) -> List[Dict[str, Any]]:
-    """Get all trades for a specific year (for year-end review)."""
-    with get_connection() as conn:
-        cursor = conn.execute(
-            """
-            SELECT tr.*, t.symbol, t.name, t.contract_address, t.chain,
-                   p.realized_pnl_usd as position_pnl
-            FROM trades tr
-            JOIN tokens t ON t.id = tr.token_id
-            LEFT JOIN positions p ON p.id = tr.position_id
-            WHERE strftime('%Y', tr.trade_timestamp) = ?
-            ORDER BY tr.trade_timestamp
-            """,
-            (str(year),)
-        )
-        return [dict(row) for row in cursor.fetchall()]
+    The filter is a plain range on trade_timestamp rather than
+    strftime('%Y', ...) - wrapping the column in a function would force a
+    full scan, while a range predicate can use the timestamp index.
+    """
+    conn = get_connection()
+    yield from conn.execute(
+        """
+        SELECT tr.*, t.symbol, t.name, t.contract_address, t.chain,
+               p.realized_pnl_usd as position_pnl
+        FROM trades tr
+        JOIN tokens t ON t.id = tr.token_id
+        LEFT JOIN positions p ON p.id = tr.position_id
+        WHERE tr.trade_timestamp >= ? AND tr.trade_timestamp < ?
+        ORDER BY tr.trade_timestamp
+        """,
+        (f"{year}-01-01", f"{year + 1}-01-01")
+    )
+
+
+def get_all_trades_for_year(year: int) -> List[sqlite3.Row]:
+    """Get a year's trades as a list (see iter_all_trades_for_year)."""
+    return list(iter_all_trades_for_year(year))
 
 
 # =============================================================================
 # STATISTICS
 # =============================================================================
 
+def get_portfolio_totals() -> sqlite3.Row:
+    """
+    Portfolio-wide totals in one aggregate row.
+
+    The summing happens inside SQLite's C aggregator over the open-
+    positions index; Python receives one row instead of accumulating
+    floats across N position rows. Realized PnL spans all positions
+    (closed ones carry most of it), matching what get_trading_stats
+    reports.
+    """
+    conn = get_connection()
+    return conn.execute(
+        """
+        SELECT
+            (SELECT COALESCE(SUM(total_cost_usd), 0) FROM positions
+             WHERE status IN ('OPEN', 'PARTIAL')) AS total_invested_usd,
+            (SELECT COALESCE(SUM(realized_pnl_usd), 0)
+             FROM positions) AS realized_pnl_usd,
+            (SELECT COUNT(*) FROM positions
+             WHERE status IN ('OPEN', 'PARTIAL')) AS open_positions
+        """
+    ).fetchone()
+
+
 def get_trading_stats() -> Dict[str, Any]:
-    """Get overall trading statistics."""
-    with get_connection() as conn:
-        # Total trades
-        total_trades = conn.execute(
-            "SELECT COUNT(*) as count FROM trades"
-        ).fetchone()['count']
-
-        # Total positions
-        total_positions = conn.execute(
-            "SELECT COUNT(*) as count FROM positions"
-        ).fetchone()['count']
-
-        # Open positions
-        open_positions = conn.execute(
-            "SELECT COUNT(*) as count FROM positions WHERE status IN ('OPEN', 'PARTIAL')"
-        ).fetchone()['count']
-
-        # Total realized PnL
-        total_pnl = conn.execute(
-            "SELECT COALESCE(SUM(realized_pnl_usd), 0) as total FROM positions"
-        ).fetchone()['total']
-
-        # Total invested (sum of all buys)
-        total_invested = conn.execute(
-            """
-            SELECT COALESCE(SUM(total_value_usd), 0) as total
-            FROM trades WHERE trade_type = 'BUY'
-            """
-        ).fetchone()['total']
-
-        return {
-            'total_trades': total_trades,
-            'total_positions': total_positions,
-            'open_positions': open_positions,
-            'realized_pnl_usd': total_pnl,
-            'total_invested_usd': total_invested
-        }
+    """
+    Get overall trading statistics.
+
+    All five numbers come back in one statement (scalar subqueries in a
+    single SELECT) instead of five separate round-trips.
+    """
+    conn = get_connection()
+    row = conn.execute(
+        """
+        SELECT
+            (SELECT COUNT(*) FROM trades) AS total_trades,
+            (SELECT COUNT(*) FROM positions) AS total_positions,
+            (SELECT COUNT(*) FROM positions
+             WHERE status IN ('OPEN', 'PARTIAL')) AS open_positions,
+            (SELECT COALESCE(SUM(realized_pnl_usd), 0)
+             FROM positions) AS realized_pnl_usd,
+            (SELECT COALESCE(SUM(total_value_usd), 0)
+             FROM trades WHERE trade_type = 'BUY') AS total_invested_usd
+        """
+    ).fetchone()
+
+    return {
+        'total_trades': row['total_trades'],
+        'total_positions': row['total_positions'],
+        'open_positions': row['open_positions'],
+        'realized_pnl_usd': row['realized_pnl_usd'],
+        'total_invested_usd': row['total_invested_usd']
+    }
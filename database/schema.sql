@@ -27,7 +27,7 @@ PRAGMA foreign_keys = ON;
 
 CREATE TABLE IF NOT EXISTS wallets (
     id INTEGER PRIMARY KEY AUTOINCREMENT,  -- Auto-generated unique ID
-    address TEXT NOT NULL,                  -- Wallet address (0x... or Solana format)
+    address TEXT NOT NULL COLLATE NOCASE,   -- Wallet address (0x... or Solana format)
     chain TEXT NOT NULL,                    -- 'ethereum', 'solana', 'base', 'bsc', etc.
     nickname TEXT,                          -- Optional friendly name like "Main Wallet"
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
@@ -44,9 +44,9 @@ CREATE TABLE IF NOT EXISTS wallets (
 
 CREATE TABLE IF NOT EXISTS tokens (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
-    contract_address TEXT NOT NULL,         -- The token's contract address
+    contract_address TEXT NOT NULL COLLATE NOCASE,  -- The token's contract address
     chain TEXT NOT NULL,                    -- Which blockchain
-    symbol TEXT,                            -- Ticker like "PEPE" or "WIF"
+    symbol TEXT COLLATE NOCASE,             -- Ticker like "PEPE" or "WIF"
     name TEXT,                              -- Full name like "Pepe" or "dogwifhat"
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
 
@@ -75,6 +75,20 @@ CREATE TABLE IF NOT EXISTS positions (
     -- Status: OPEN (holding), PARTIAL (sold some), CLOSED (fully exited)
     status TEXT DEFAULT 'OPEN' CHECK(status IN ('OPEN', 'PARTIAL', 'CLOSED')),
 
+    -- LEARNING MOMENT: Denormalization
+    -- symbol/chain/contract_address really "belong" to the tokens table,
+    -- but the list views (/positions, /log) want them for every row. Copying
+    -- them here lets those views read one table instead of JOINing on every
+    -- render. The tokens_position_sync trigger below keeps symbol in sync.
+    symbol TEXT COLLATE NOCASE,
+    chain TEXT,
+    contract_address TEXT COLLATE NOCASE,
+
+    -- Computed once at insert: perp/CEX positions use synthetic addresses
+    -- like "BTC_hyperliquid" instead of a real contract. Storing the flag
+    -- saves re-deriving it from the address string on every render.
+    is_perp INTEGER DEFAULT 0,
+
     -- Aggregated quantities (updated as trades happen)
     total_bought REAL DEFAULT 0,            -- Total tokens ever bought
     total_sold REAL DEFAULT 0,              -- Total tokens ever sold
@@ -87,6 +101,11 @@ CREATE TABLE IF NOT EXISTS positions (
     -- Profit and Loss
     realized_pnl_usd REAL DEFAULT 0,        -- Profit/loss from sold portions
 
+    -- Average cost basis, maintained on every BUY. Caching the division
+    -- here means sells and display paths read a column instead of
+    -- recomputing total_cost_usd / total_bought each time.
+    avg_cost_usd REAL,
+
     -- Timestamps
     opened_at TIMESTAMP,                    -- When first buy happened
     closed_at TIMESTAMP,                    -- When fully sold (if applicable)
@@ -129,6 +148,23 @@ CREATE TABLE IF NOT EXISTS trades (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP  -- When we recorded it
 );
 
+-- ============================================================================
+-- TOKEN PRICES TABLE
+-- ============================================================================
+-- Last-known live price per token, refreshed whenever /positions fetches
+-- from DEX Screener. Keeping prices in a table lets the unrealized PnL
+-- arithmetic happen inside one SQL query (see get_positions_with_live_pnl)
+-- and means a flaky API call shows the last good price instead of nothing.
+
+CREATE TABLE IF NOT EXISTS token_prices (
+    contract_address TEXT NOT NULL COLLATE NOCASE,
+    chain TEXT NOT NULL,
+    price_usd REAL,
+    fetched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+
+    UNIQUE(contract_address, chain)
+);
+
 -- ============================================================================
 -- INDEXES
 -- ============================================================================
@@ -150,3 +186,45 @@ CREATE INDEX IF NOT EXISTS idx_tokens_contract ON tokens(contract_address, chain
 
 -- Find positions by token quickly
 CREATE INDEX IF NOT EXISTS idx_positions_token ON positions(token_id);
+
+-- Composite indexes matching the hot query predicates in models.py.
+-- Without these, SQLite falls back to scanning whole tables, which gets
+-- slower the longer the journal runs.
+
+-- get_open_position: WHERE token_id = ? AND status IN (...) ORDER BY opened_at DESC
+CREATE INDEX IF NOT EXISTS ix_positions_token_status
+    ON positions(token_id, status, opened_at DESC);
+
+-- find_token_by_symbol: WHERE symbol = ? (NOCASE collation, see tokens DDL)
+CREATE INDEX IF NOT EXISTS ix_tokens_symbol ON tokens(symbol);
+
+-- get_open_positions_by_symbol: WHERE symbol = ? AND status IN (...)
+CREATE INDEX IF NOT EXISTS ix_positions_symbol ON positions(symbol, status);
+
+-- get_all_trades / get_all_trades_for_year: ORDER BY trade_timestamp DESC
+CREATE INDEX IF NOT EXISTS ix_trades_ts ON trades(trade_timestamp DESC);
+
+-- get_trades_for_position: WHERE position_id = ? ORDER BY trade_timestamp
+CREATE INDEX IF NOT EXISTS ix_trades_position
+    ON trades(position_id, trade_timestamp);
+
+-- get_trading_stats: SUM(total_value_usd) WHERE trade_type = 'BUY'.
+-- A covering index - both the filter column and the summed column live in
+-- the index itself, so the scan never touches the trades table at all.
+CREATE INDEX IF NOT EXISTS ix_trades_buy_val ON trades(trade_type, total_value_usd);
+
+-- get_all_open_positions: partial index covering only live positions
+CREATE INDEX IF NOT EXISTS ix_positions_open
+    ON positions(opened_at DESC) WHERE status IN ('OPEN', 'PARTIAL');
+
+-- ============================================================================
+-- TRIGGERS
+-- ============================================================================
+
+-- Keep the denormalized positions.symbol current when a token's symbol is
+-- learned later (e.g., first trade had no symbol, DEX Screener filled it in).
+CREATE TRIGGER IF NOT EXISTS tokens_position_sync
+AFTER UPDATE OF symbol ON tokens
+BEGIN
+    UPDATE positions SET symbol = NEW.symbol WHERE token_id = NEW.id;
+END;
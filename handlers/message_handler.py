@@ -17,20 +17,90 @@ It just coordinates between them. This makes each piece easier to test
 and modify independently.
 """
 
+import asyncio
+import io
+
 from telegram import Update
 from telegram.ext import ContextTypes
 
 from parsing.message_parser import parse_message, format_parse_summary, ParseResult
 from services.position_tracker import (
     process_trade,
+    process_trades_bulk,
     TradeResult,
     find_position_for_exit,
     get_portfolio_summary
 )
-from services.dex_screener import get_token_info, DexScreenerError
+from services.dex_screener import get_token_info, get_token_infos_batch, DexScreenerError
 from database import models
 
 
+# One lock per chat. The application dispatches updates concurrently
+# (concurrent_updates=True in bot.py); this keeps trade messages within a
+# single chat processed in order while different chats run in parallel.
+_chat_locks: dict = {}
+
+
+def _get_chat_lock(chat_id: int) -> asyncio.Lock:
+    """Get (or lazily create) the ordering lock for a chat."""
+    lock = _chat_locks.get(chat_id)
+    if lock is None:
+        lock = _chat_locks.setdefault(chat_id, asyncio.Lock())
+    return lock
+
+
+# How long a handler may run before the "⏳" indicator is worth sending.
+# Telegram caps bots at ~30 messages/second across all chats, so every
+# skipped loading ping is budget for a real reply.
+_LOADING_DELAY = 0.5
+
+
+async def _delayed_loading(update: Update, text: str):
+    """Send the loading indicator only after _LOADING_DELAY has passed.
+
+    LEARNING MOMENT: Don't Pay for Feedback Nobody Sees
+    A loading message that gets replaced half a second later just doubles
+    the bot's API calls. Scheduling it as a delayed task means fast
+    responses (cache hits, parse failures) skip it entirely, while slow
+    work (API calls taking 1-3 seconds) still shows users the bot is busy.
+    """
+    await asyncio.sleep(_LOADING_DELAY)
+    return await update.message.reply_text(text)
+
+
+# Telegram rejects messages over 4096 characters. Building replies against
+# this budget (with headroom for the footer) means an oversized portfolio is
+# split at position boundaries up front, instead of sending, getting the
+# error back, and re-sending - which would double the latency on exactly
+# the heaviest replies.
+_MSG_LIMIT = 4000
+
+# Hard ceiling on any single price fetch during /positions. One slow DEX
+# Screener response shouldn't hold the whole reply hostage - past this the
+# row falls back to its last stored price, same as a failed fetch.
+_PRICE_FETCH_TIMEOUT = 2.0
+
+
+async def _finish_reply(update: Update, loading_task: asyncio.Task, text: str) -> None:
+    """Deliver the final text: edit the loading message if it was sent,
+    otherwise cancel it and reply directly.
+
+    Replies are deliberately plain text - no parse_mode, no entities.
+    Telegram only runs its markdown/HTML parser when asked, so plain sends
+    skip that backend work entirely and can never fail on an unescaped
+    character in a token symbol.
+    """
+    loading_task.cancel()
+    try:
+        loading_msg = await loading_task
+    except asyncio.CancelledError:
+        loading_msg = None
+    if loading_msg is not None:
+        await loading_msg.edit_text(text)
+    else:
+        await update.message.reply_text(text)
+
+
 async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """
     Handle an incoming text message.
@@ -46,37 +116,54 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     if not text:
         return
 
-    # Send a loading indicator immediately so user knows bot is working
-    # LEARNING MOMENT: User Experience
-    # API calls can take 1-3 seconds. Without feedback, users think the bot is broken.
-    # We send a "processing" message first, then edit it with the result.
-    loading_msg = await update.message.reply_text("⏳ Processing...")
+    # Serialize trade processing per chat: two quick messages in the same
+    # chat must hit the database in the order they were sent
+    async with _get_chat_lock(update.effective_chat.id):
+        # Schedule the loading indicator; it only actually sends if the
+        # work below takes longer than _LOADING_DELAY (see _delayed_loading).
+        # Because it's a task rather than an await, the Telegram send runs
+        # concurrently with the parse below - the multi-second Claude call
+        # never waits behind the ~150ms sendMessage round-trip.
+        loading_task = asyncio.create_task(_delayed_loading(update, "⏳ Processing..."))
 
-    try:
-        # Parse the message
-        result = parse_message(text)
-
-        if not result.success:
-            # Parsing failed - edit loading message with error
-            await loading_msg.edit_text(
-                f"❌ Couldn't parse that message:\n{result.error_message}\n\n"
-                "Please include a contract address or DEX Screener link."
-            )
-            return
+        try:
+            # Parse the message
+            # LEARNING MOMENT: Don't Block the Event Loop
+            # parse_message and process_trade do blocking work (Claude API,
+            # DEX Screener, SQLite). Run them in a worker thread via
+            # asyncio.to_thread so the loop keeps servicing other updates.
+            result = await asyncio.to_thread(parse_message, text)
+
+            if not result.success:
+                # Parsing failed - report the error
+                await _finish_reply(
+                    update, loading_task,
+                    f"❌ Couldn't parse that message:\n{result.error_message}\n\n"
+                    "Please include a contract address or DEX Screener link."
+                )
+                return
+
+            # Process the trades. Multi-trade messages go through the bulk
+            # path, which dedupes price lookups and batches the database
+            # writes into a handful of transactions (see process_trades_bulk)
+            if len(result.trades) > 1:
+                trade_results = await asyncio.to_thread(process_trades_bulk, result.trades)
+            else:
+                trade_results = [await asyncio.to_thread(process_trade, result.trades[0])]
 
-        # Process each trade in the message
-        responses = []
-        for parsed_trade in result.trades:
-            trade_result = process_trade(parsed_trade)
-            responses.append(format_trade_result(trade_result))
+            # Stream the formatted results into one buffer - no intermediate
+            # list of strings and no second full-size allocation from a join
+            buf = io.StringIO()
+            for i, trade_result in enumerate(trade_results):
+                if i:
+                    buf.write("\n\n")
+                buf.write(format_trade_result(trade_result))
 
-        # Edit loading message with the result
-        reply = "\n\n".join(responses)
-        await loading_msg.edit_text(reply)
+            await _finish_reply(update, loading_task, buf.getvalue())
 
-    except Exception as e:
-        # If anything goes wrong, show error instead of leaving "Processing..."
-        await loading_msg.edit_text(f"❌ Error: {str(e)}")
+        except Exception as e:
+            # If anything goes wrong, show error instead of leaving "Processing..."
+            await _finish_reply(update, loading_task, f"❌ Error: {str(e)}")
 
 
 async def handle_balance_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -97,102 +184,177 @@ async def handle_positions_command(update: Update, context: ContextTypes.DEFAULT
     2. Calculate: current_value = tokens_held * current_price
     3. Calculate: unrealized_pnl = current_value - what_you_paid
     """
-    loading_msg = await update.message.reply_text("⏳ Loading positions and fetching live prices...")
+    loading_task = asyncio.create_task(
+        _delayed_loading(update, "⏳ Loading positions and fetching live prices...")
+    )
 
     try:
-        positions = models.get_all_open_positions()
+        # Kick off the stats query now; its result isn't needed until the
+        # footer, so it runs while the price fetches below are in flight
+        # (DB and HTTP latency overlap instead of adding up)
+        stats_task = asyncio.create_task(asyncio.to_thread(models.get_trading_stats))
+
+        positions = await asyncio.to_thread(models.get_all_open_positions)
 
         if not positions:
-            await loading_msg.edit_text("No open positions.")
+            stats_task.cancel()
+            await _finish_reply(update, loading_task, "No open positions.")
             return
 
-        lines = ["📊 Open Positions", "─" * 25]
-
-        # Totals for spot tokens (where we can fetch prices)
-        total_invested = 0
-        total_current_value = 0
-        total_unrealized_pnl = 0
-        spot_positions_count = 0
-
-        for pos in positions:
-            symbol = pos.get('symbol', 'UNKNOWN')
-            chain = pos.get('chain', '?')
-            contract_address = pos.get('contract_address', '')
-            remaining = pos.get('remaining_tokens', 0) or 0
-            cost = pos.get('total_cost_usd', 0) or 0
-
-            total_invested += cost
-
-            # Format tokens held
-            if remaining >= 1_000_000:
-                remaining_str = f"{remaining/1_000_000:.1f}M"
-            elif remaining >= 1_000:
-                remaining_str = f"{remaining/1_000:.1f}K"
+        # Pass 1: fetch every price up front, batched by chain.
+        #
+        # LEARNING MOMENT: Concurrent + Batched I/O
+        # Fetching prices one-by-one means 20 positions = 20 round-trips in
+        # a row (~6 seconds at 300ms each). DEX Screener's multi-token
+        # endpoint takes up to 30 addresses per chain in ONE request, so we
+        # group positions by chain, fire one batch per chain, and run those
+        # batches concurrently - typically a single round-trip total.
+        # return_exceptions=True hands failures back as values instead of
+        # cancelling the rest of the batch.
+        by_chain: dict = {}     # chain -> list of contract addresses
+        singles: dict = {}      # idx -> task, for rows missing a chain hint
+        for idx, pos in enumerate(positions):
+            # is_perp is precomputed at insert (synthetic perp/CEX addresses
+            # like "BTC_hyperliquid" have no on-chain price to fetch)
+            if pos['is_perp']:
+                continue
+            contract_address = pos['contract_address'] or ''
+            # 'unknown' is a stored placeholder, not a real chain id - the
+            # chain-keyed batch endpoint 404s on it, while the single-token
+            # fallback uses the chain-agnostic search and still finds a price
+            if pos['chain'] and pos['chain'] != 'unknown':
+                by_chain.setdefault(pos['chain'], []).append(contract_address)
             else:
-                remaining_str = f"{remaining:,.0f}"
-
-            lines.append(f"• {symbol} ({chain})")
-            lines.append(f"  {remaining_str} tokens | ${cost:,.0f} invested")
-
-            # Check if this is a perp/CEX position (synthetic address)
-            # LEARNING MOMENT: Identifying Perps vs Spot
-            # Perps use synthetic addresses like "BTC_hyperliquid" or "ETH_binance"
-            # Real on-chain tokens have hex addresses starting with 0x (or base58 for Solana)
-            is_perp = '_' in contract_address and not contract_address.startswith('0x')
-
-            if is_perp:
-                lines.append("  ⚠️ Price unavailable (perp)")
+                singles[idx] = asyncio.wait_for(
+                    asyncio.to_thread(get_token_info, contract_address, None),
+                    _PRICE_FETCH_TIMEOUT,
+                )
+
+        # wait_for bounds the reply's tail latency: a timed-out fetch is
+        # reported as TimeoutError here (the worker thread finishes in the
+        # background and just feeds the cache for next time)
+        batch_tasks = [
+            asyncio.wait_for(
+                asyncio.to_thread(get_token_infos_batch, chain, addresses),
+                _PRICE_FETCH_TIMEOUT,
+            )
+            for chain, addresses in by_chain.items()
+        ]
+        fetched = await asyncio.gather(
+            *batch_tasks, *singles.values(), return_exceptions=True
+        )
+        batch_results = fetched[:len(batch_tasks)]
+        single_results = fetched[len(batch_tasks):]
+
+        # Store the fetched prices, then let SQL do the arithmetic. Tokens
+        # whose fetch failed keep their previous stored price (if any), so
+        # a flaky API call degrades to a slightly stale number.
+        price_rows = []
+        failed_chains = set()
+        for chain, result in zip(by_chain, batch_results):
+            if isinstance(result, (DexScreenerError, TimeoutError)):
+                failed_chains.add(chain)
+            elif isinstance(result, BaseException):
+                raise result
             else:
-                # Fetch live price from DEX Screener
-                try:
-                    token_info = get_token_info(contract_address, chain)
-
-                    if token_info and token_info.price_usd:
-                        current_value = remaining * token_info.price_usd
-                        unrealized_pnl = current_value - cost
-
-                        # Track totals for spot tokens
-                        total_current_value += current_value
-                        total_unrealized_pnl += unrealized_pnl
-                        spot_positions_count += 1
-
-                        # Format PnL with sign and percentage
-                        if cost > 0:
-                            pnl_pct = (unrealized_pnl / cost) * 100
-                            pnl_sign = "+" if unrealized_pnl >= 0 else ""
-                            pnl_emoji = "💰" if unrealized_pnl >= 0 else "📉"
-                            lines.append(f"  {pnl_emoji} Now: ${current_value:,.0f} | {pnl_sign}${unrealized_pnl:,.0f} ({pnl_sign}{pnl_pct:.1f}%)")
-                        else:
-                            lines.append(f"  💰 Now: ${current_value:,.0f}")
-                    else:
-                        lines.append("  ⚠️ Price unavailable")
-
-                except DexScreenerError:
-                    lines.append("  ⚠️ Price fetch failed")
-
-        lines.append("─" * 25)
-        lines.append(f"Total invested: ${total_invested:,.0f}")
+                for address, info in result.items():
+                    if info.price_usd is not None:
+                        price_rows.append((address, chain, info.price_usd))
+
+        # Chain-less rows were fetched individually; keep their info in
+        # Python since they can't join token_prices on chain
+        single_infos: dict = {}
+        single_failed = set()
+        for idx, result in zip(singles.keys(), single_results):
+            if isinstance(result, (DexScreenerError, TimeoutError)):
+                single_failed.add(idx)
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                single_infos[idx] = result
+
+        await asyncio.to_thread(models.upsert_token_prices, price_rows)
+
+        # Pass 2: one query returns every position with current value,
+        # unrealized PnL and the portfolio totals already computed
+        # (see models.get_positions_with_live_pnl) - this loop only
+        # formats strings
+        rows = await asyncio.to_thread(models.get_positions_with_live_pnl)
+
+        def _live_for(idx, pos):
+            """(value, pnl, pct) - from SQL for joined rows, inline for the
+            rare chain-less position; None when no price is known."""
+            if pos['live_price_usd'] is not None:
+                return (pos['current_value_usd'], pos['unrealized_pnl_usd'],
+                        pos['unrealized_pnl_pct'])
+            info = single_infos.get(idx)
+            if info and info.price_usd:
+                cost = pos['total_cost_usd'] or 0
+                current_value = (pos['remaining_tokens'] or 0) * info.price_usd
+                unrealized_pnl = current_value - cost
+                pnl_pct = (unrealized_pnl / cost) * 100 if cost > 0 else None
+                return (current_value, unrealized_pnl, pnl_pct)
+            return None
+
+        # Assemble the reply with a running length, flushing a finished
+        # chunk whenever the next block would push past _MSG_LIMIT. Tracking
+        # the count as blocks are appended avoids re-measuring the buffer.
+        parts = []
+        buf = [f"📊 Open Positions\n{'─' * 25}"]
+        buf_len = len(buf[0])
+        for idx, pos in enumerate(rows):
+            block = _format_position_block(
+                pos,
+                _live_for(idx, pos),
+                pos['chain'] in failed_chains or idx in single_failed,
+            )
+            if buf_len + len(block) + 1 > _MSG_LIMIT:
+                parts.append("\n".join(buf))
+                buf = ["📊 Open Positions (continued)"]
+                buf_len = len(buf[0])
+            buf.append(block)
+            buf_len += len(block) + 1
+
+        # Portfolio totals come back on every row via the window functions
+        footer = []
+        totals = rows[0] if rows else None
+        total_invested = (totals['total_invested_usd'] or 0) if totals else 0
+        footer.append("─" * 25)
+        footer.append(f"Total invested: ${total_invested:,.0f}")
 
         # Show unrealized PnL summary for spot positions
-        if spot_positions_count > 0:
+        if totals and totals['priced_positions'] > 0:
+            total_current_value = totals['total_current_value_usd'] or 0
+            total_unrealized_pnl = totals['total_unrealized_pnl_usd'] or 0
             total_pnl_sign = "+" if total_unrealized_pnl >= 0 else ""
             if total_invested > 0:
                 total_pnl_pct = (total_unrealized_pnl / total_invested) * 100
                 pnl_emoji = "💰" if total_unrealized_pnl >= 0 else "📉"
-                lines.append(f"{pnl_emoji} Current value: ${total_current_value:,.0f} (spot)")
-                lines.append(f"📊 Unrealized PnL: {total_pnl_sign}${total_unrealized_pnl:,.0f} ({total_pnl_sign}{total_pnl_pct:.1f}%)")
+                footer.append(f"{pnl_emoji} Current value: ${total_current_value:,.0f} (spot)")
+                footer.append(f"📊 Unrealized PnL: {total_pnl_sign}${total_unrealized_pnl:,.0f} ({total_pnl_sign}{total_pnl_pct:.1f}%)")
 
-        # Add realized PnL
-        stats = models.get_trading_stats()
+        # Add realized PnL (query started before the price fetches)
+        stats = await stats_task
         if stats['realized_pnl_usd'] != 0:
             pnl = stats['realized_pnl_usd']
             pnl_emoji = "📈" if pnl > 0 else "📉"
-            lines.append(f"{pnl_emoji} Realized PnL: ${pnl:,.2f}")
+            footer.append(f"{pnl_emoji} Realized PnL: ${pnl:,.2f}")
 
-        await loading_msg.edit_text("\n".join(lines))
+        footer_text = "\n".join(footer)
+        if buf_len + len(footer_text) + 1 > _MSG_LIMIT:
+            parts.append("\n".join(buf))
+            buf = []
+        buf.append(footer_text)
+        parts.append("\n".join(buf))
+
+        # First chunk replaces the loading message; overflow chunks (rare)
+        # follow as plain replies
+        await _finish_reply(update, loading_task, parts[0])
+        for part in parts[1:]:
+            await update.message.reply_text(part)
 
     except Exception as e:
-        await loading_msg.edit_text(f"❌ Error: {str(e)}")
+        await _finish_reply(update, loading_task, f"❌ Error: {str(e)}")
 
 
 async def handle_log_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -201,75 +363,139 @@ async def handle_log_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
 
     Shows the trade journal history, most recent first.
     """
-    loading_msg = await update.message.reply_text("⏳ Loading trade log...")
+    loading_task = asyncio.create_task(_delayed_loading(update, "⏳ Loading trade log..."))
 
     try:
-        trades = models.get_all_trades(limit=20)  # Last 20 trades
+        trades = await asyncio.to_thread(models.get_all_trades, limit=20)  # Last 20 trades
 
         if not trades:
-            await loading_msg.edit_text("No trades recorded yet.")
+            await _finish_reply(update, loading_task, "No trades recorded yet.")
             return
 
-        lines = ["📒 Trade Log (last 20)", "─" * 30]
+        body = "\n".join(_format_log_row(trade) for trade in trades)
+        await _finish_reply(
+            update, loading_task,
+            f"📒 Trade Log (last 20)\n{'─' * 30}\n"
+            f"{body}\n{'─' * 30}\n"
+            "✓ = closed | ◐ = partial"
+        )
 
-        for trade in trades:
-            symbol = trade.get('symbol', '???')
-            trade_type = trade.get('trade_type', '?')
-            chain = trade.get('chain', '?')
-            amount = trade.get('amount_spent') or trade.get('total_value_usd') or 0
-            currency = trade.get('spend_currency', 'USD')
-            timestamp = trade.get('trade_timestamp', '')
-            position_status = trade.get('position_status', '')
+    except Exception as e:
+        await _finish_reply(update, loading_task, f"❌ Error: {str(e)}")
 
-            # Format timestamp (just date)
-            if timestamp:
-                date_str = str(timestamp)[:10]  # YYYY-MM-DD
-            else:
-                date_str = "?"
 
-            # Trade type emoji
-            type_emoji = "🟢" if trade_type == 'BUY' else "🔴"
+# Scale table for compact number formatting. The scale factor turns the
+# division into a multiply, which is cheaper per row.
+_UNITS = ((1_000_000, 'M', 1e-6), (1_000, 'K', 1e-3))
 
-            # Position status indicator
-            status_indicator = ""
-            if position_status == 'CLOSED':
-                status_indicator = " ✓"
-            elif position_status == 'PARTIAL':
-                status_indicator = " ◐"
 
-            # Format amount
-            if amount >= 1000:
-                amount_str = f"${amount/1000:.1f}K"
-            else:
-                amount_str = f"${amount:.0f}"
+def _fmt_short(value: float) -> str:
+    """Format 1500000 -> '1.5M', 1500 -> '1.5K', 950 -> '950'."""
+    for threshold, suffix, scale in _UNITS:
+        if value >= threshold:
+            return f"{value * scale:.1f}{suffix}"
+    return f"{value:,.0f}"
 
-            lines.append(f"{type_emoji} {date_str} | {symbol} ({chain}) | {amount_str}{status_indicator}")
 
-        lines.append("─" * 30)
-        lines.append("✓ = closed | ◐ = partial")
+def _format_position_block(pos, live, fetch_failed: bool) -> str:
+    """Render one /positions entry (2-3 lines) as a single string.
 
-        await loading_msg.edit_text("\n".join(lines))
+    Args:
+        pos: Row from get_positions_with_live_pnl
+        live: Precomputed (current_value, unrealized_pnl, pnl_pct) or None
+        fetch_failed: True if this row's price fetch errored this render
+    """
+    symbol = pos['symbol'] or 'UNKNOWN'
+    chain = pos['chain'] or '?'
+    remaining = pos['remaining_tokens'] or 0
+    cost = pos['total_cost_usd'] or 0
+
+    remaining_str = _fmt_short(remaining)
+
+    if pos['is_perp']:
+        price_line = "  ⚠️ Price unavailable (perp)"
+    elif live is not None:
+        current_value, unrealized_pnl, pnl_pct = live
+        if pnl_pct is not None:
+            pnl_sign = "+" if unrealized_pnl >= 0 else ""
+            pnl_emoji = "💰" if unrealized_pnl >= 0 else "📉"
+            price_line = (f"  {pnl_emoji} Now: ${current_value:,.0f} | "
+                          f"{pnl_sign}${unrealized_pnl:,.0f} ({pnl_sign}{pnl_pct:.1f}%)")
+        else:
+            price_line = f"  💰 Now: ${current_value:,.0f}"
+    elif fetch_failed:
+        price_line = "  ⚠️ Price fetch failed"
+    else:
+        price_line = "  ⚠️ Price unavailable"
+
+    return (f"• {symbol} ({chain})\n"
+            f"  {remaining_str} tokens | ${cost:,.0f} invested\n"
+            f"{price_line}")
+
+
+def _format_log_row(trade) -> str:
+    """Render one /log line: emoji, date, symbol, chain, amount, status."""
+    amount = trade['amount_spent'] or trade['total_value_usd'] or 0
+    timestamp = trade['trade_timestamp'] or ''
+    position_status = trade['position_status'] or ''
+
+    type_emoji = "🟢" if trade['trade_type'] == 'BUY' else "🔴"
+    date_str = str(timestamp)[:10] if timestamp else "?"  # YYYY-MM-DD
+    status_indicator = (" ✓" if position_status == 'CLOSED'
+                        else " ◐" if position_status == 'PARTIAL' else "")
+    amount_str = f"${_fmt_short(amount)}" if amount >= 1000 else f"${amount:.0f}"
+
+    return (f"{type_emoji} {date_str} | {trade['symbol'] or '???'} "
+            f"({trade['chain'] or '?'}) | {amount_str}{status_indicator}")
+
+
+async def _check_db() -> str:
+    """Health check: can we reach the database?"""
+    stats = await asyncio.to_thread(models.get_trading_stats)
+    return f"✅ Database: OK ({stats['total_trades']} trades)"
 
-    except Exception as e:
-        await loading_msg.edit_text(f"❌ Error: {str(e)}")
+
+async def _check_claude() -> str:
+    """Health check: is the Claude API key configured?"""
+    from config import settings
+    if settings.anthropic_api_key:
+        return "✅ Claude API: Configured"
+    return "⚠️ Claude API: Not configured"
+
+
+# Fixed render order for the /status checks: (label, coroutine factory).
+# New checks (e.g. a DEX Screener ping) are one more entry here.
+_STATUS_CHECKS = (
+    ("Database", _check_db),
+    ("Claude API", _check_claude),
+)
 
 
 async def handle_status_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """
     Handle /status command - show bot health status.
+
+    The checks run concurrently: /status latency is the slowest single
+    check, not the sum of all of them. A failing check renders as its own
+    ❌ line instead of taking the whole reply down.
     """
-    loading_msg = await update.message.reply_text("⏳ Checking status...")
+    loading_task = asyncio.create_task(_delayed_loading(update, "⏳ Checking status..."))
 
     try:
         from datetime import datetime
-        from config import ANTHROPIC_API_KEY, ENVIRONMENT
+        from config import settings
+
+        check_results = await asyncio.gather(
+            *(factory() for _, factory in _STATUS_CHECKS),
+            return_exceptions=True,
+        )
 
         lines = ["🤖 Bot Status", "─" * 20]
 
         # Environment (local vs production)
-        if ENVIRONMENT == "railway":
+        if settings.environment == "railway":
             lines.append("🚂 Running on: Railway")
-        elif ENVIRONMENT == "digitalocean":
+        elif settings.environment == "digitalocean":
             lines.append("🌐 Running on: DigitalOcean")
         else:
             lines.append("💻 Running on: Local")
@@ -277,32 +503,25 @@ async def handle_status_command(update: Update, context: ContextTypes.DEFAULT_TY
         # Bot is running (obviously, if this responds)
         lines.append("✅ Bot: Online")
 
-        # Check database
-        try:
-            stats = models.get_trading_stats()
-            lines.append(f"✅ Database: OK ({stats['total_trades']} trades)")
-        except Exception as e:
-            lines.append(f"❌ Database: Error - {e}")
-
-        # Check Claude API
-        if ANTHROPIC_API_KEY:
-            lines.append("✅ Claude API: Configured")
-        else:
-            lines.append("⚠️ Claude API: Not configured")
+        for (label, _), result in zip(_STATUS_CHECKS, check_results):
+            if isinstance(result, BaseException):
+                lines.append(f"❌ {label}: Error - {result}")
+            else:
+                lines.append(result)
 
         # Current time
         now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         lines.append(f"🕐 Time: {now}")
 
-        await loading_msg.edit_text("\n".join(lines))
+        await _finish_reply(update, loading_task, "\n".join(lines))
 
     except Exception as e:
-        await loading_msg.edit_text(f"❌ Error: {str(e)}")
+        await _finish_reply(update, loading_task, f"❌ Error: {str(e)}")
 
 
-async def handle_start_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    """Handle /start command - welcome message."""
-    welcome = """Welcome to your Trade Journal Bot!
+# Static reply payloads for /start and /help. Built once at import instead
+# of re-allocating the multiline literal on every command.
+_WELCOME_TEXT = """Welcome to your Trade Journal Bot!
 
 Send me a message about your trades and I'll log them for you.
 
@@ -321,12 +540,8 @@ Commands:
 /log - Show trade history
 /help - Show examples
 """
-    await update.message.reply_text(welcome)
 
-
-async def handle_help_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    """Handle /help command."""
-    help_text = """Trade Journal Bot Help
+_HELP_TEXT = """Trade Journal Bot Help
 
 📝 Logging Trades:
 Just send a natural message - the bot uses AI to parse it.
@@ -349,52 +564,49 @@ Commands:
 /log - Show trade history
 /help - Show this message
 """
-    await update.message.reply_text(help_text)
 
 
-def format_trade_result(result: TradeResult) -> str:
-    """Format a trade result for display in Telegram."""
-    lines = []
-
-    # Status emoji
-    if result.success:
-        emoji = "+" if result.trade_type == 'BUY' else "-"
-        lines.append(f"{emoji} {result.trade_type} {result.token_symbol or 'token'}")
-    else:
-        lines.append(f"Failed: {result.message}")
-        return "\n".join(lines)
+async def handle_start_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Handle /start command - welcome message."""
+    await update.message.reply_text(_WELCOME_TEXT)
 
-    # Amount spent
-    if result.amount_spent and result.spend_currency:
-        if result.spend_currency in ('USD', 'USDC', 'USDT'):
-            lines.append(f"Spent: ${result.amount_spent:,.2f} {result.spend_currency}")
-        else:
-            lines.append(f"Spent: {result.amount_spent:,.4f} {result.spend_currency}")
 
-    # Tokens acquired
-    if result.amount_tokens:
-        lines.append(f"Tokens: {result.amount_tokens:,.2f}")
+async def handle_help_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Handle /help command."""
+    await update.message.reply_text(_HELP_TEXT)
 
-    # Price at trade
-    if result.price_usd:
-        lines.append(f"Price: ${result.price_usd:.8f}")
 
-    # Market cap
-    if result.market_cap:
-        if result.market_cap >= 1_000_000:
-            mcap_str = f"${result.market_cap / 1_000_000:.1f}M"
-        else:
-            mcap_str = f"${result.market_cap / 1_000:,.0f}K"
-        lines.append(f"MCAP: {mcap_str}")
+# Fixed layout for a successful trade reply. Every optional slot is either
+# "" or a chunk carrying its own leading newline, so rendering is a single
+# format_map pass over a prebuilt template - no parts list, no filter, no
+# join, even when this runs in a loop over a multi-trade message.
+_TRADE_RESULT_TEMPLATE = (
+    "{emoji} {trade_type} {symbol}"
+    "{spent}{tokens}{price}{mcap}{position}{warning}"
+)
 
-    # Position summary
-    if result.position_summary:
-        lines.append("")
-        lines.append(result.position_summary)
 
-    # Any warnings
-    if result.message and "Warning" in result.message:
-        lines.append("")
-        lines.append(result.message)
+def format_trade_result(result: TradeResult) -> str:
+    """Format a trade result for display in Telegram."""
+    if not result.success:
+        return f"Failed: {result.message}"
 
-    return "\n".join(lines)
+    spent = ""
+    if result.amount_spent and result.spend_currency:
+        spent = (f"\nSpent: ${result.amount_spent:,.2f} {result.spend_currency}"
+                 if result.spend_currency in ('USD', 'USDC', 'USDT')
+                 else f"\nSpent: {result.amount_spent:,.4f} {result.spend_currency}")
+
+    return _TRADE_RESULT_TEMPLATE.format_map({
+        'emoji': "+" if result.trade_type == 'BUY' else "-",
+        'trade_type': result.trade_type,
+        'symbol': result.token_symbol or 'token',
+        'spent': spent,
+        'tokens': f"\nTokens: {result.amount_tokens:,.2f}" if result.amount_tokens else "",
+        'price': f"\nPrice: ${result.price_usd:.8f}" if result.price_usd else "",
+        'mcap': f"\nMCAP: ${_fmt_short(result.market_cap)}" if result.market_cap else "",
+        # Double newline keeps the blank separator line these had before
+        'position': f"\n\n{result.position_summary}" if result.position_summary else "",
+        'warning': (f"\n\n{result.message}"
+                    if result.message and "Warning" in result.message else ""),
+    })
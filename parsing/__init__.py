@@ -1 +1,15 @@
 # This file makes the parsing folder a "Python package"
+#
+# A note on speed: the hot paths in this package (address scanning, keyword
+# detection) are already single C-level regex calls, so an AOT compile of
+# the package (mypyc/Cython) was evaluated and skipped - it would add a
+# build step and a compiled-artifact deploy story to a repo that runs as
+# plain `python bot.py`, to shave interpreter overhead that is dwarfed by
+# the Claude and DEX Screener network calls on either side of it.
+#
+# A Hyperscan multi-pattern database (python-hyperscan) was weighed for the
+# same reason and also skipped: the extractors were instead fused into a
+# handful of alternation regexes (see patterns.py), which gets the
+# one-pass-over-the-message property without a native dependency, and
+# Hyperscan cannot express the lookbehind/lookahead boundary assertions the
+# address patterns rely on.
@@ -27,37 +27,35 @@ We use Claude API as the primary parser because:
 The regex code is kept as a fallback in case the API fails.
 """
 
-from typing import Optional, List, Dict, Any
-from dataclasses import dataclass, field
+from typing import Optional, List, Dict, Any, Tuple
+from dataclasses import dataclass, field, replace
 import logging
+import threading
 
 # Try to import Claude parser
 try:
     from services.claude_parser import parse_with_claude, ClaudeParsedTrade, ANTHROPIC_AVAILABLE
-    from config import ANTHROPIC_API_KEY
-    CLAUDE_AVAILABLE = ANTHROPIC_AVAILABLE and ANTHROPIC_API_KEY
+    from config import settings
+    CLAUDE_AVAILABLE = ANTHROPIC_AVAILABLE and settings.anthropic_api_key
 except ImportError:
     CLAUDE_AVAILABLE = False
 
 from .patterns import (
-    extract_evm_addresses,
-    extract_solana_addresses,
-    extract_dexscreener_info,
-    extract_usd_amounts,
-    extract_crypto_amounts,
-    extract_market_cap,
+    ADDRESS_SCANNER_PATTERN,
+    extract_link_info,
+    extract_amounts,
     detect_trade_type,
     extract_urls,
     extract_perp_info,
+    find_perp_symbol,
     detect_exchange,
-    is_perp_trade,
     is_spot_trade,
     extract_cex_spot_info,
 )
 from .chain_detector import ChainInfo, create_chain_info, detect_chain_from_text
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedTrade:
     """
     Structured data extracted from a trade message.
@@ -92,7 +90,7 @@ class ParsedTrade:
     missing_fields: List[str] = field(default_factory=list)  # What we couldn't extract
 
 
-@dataclass
+@dataclass(slots=True)
 class ParseResult:
     """
     Result of parsing a message, which might contain multiple trades.
@@ -103,11 +101,38 @@ class ParseResult:
     error_message: Optional[str] = None
 
 
+# Recently parsed messages, keyed on the exact text. Telegram redeliveries
+# and users re-sending a message are common enough that skipping the
+# duplicate Claude call (~500ms and a real API charge) pays for a small
+# dict. Only successful parses are cached, so a transient Claude failure
+# is retried next time rather than pinned. parse_message runs on worker
+# threads, hence the lock.
+_PARSE_CACHE_MAX = 256
+_parse_cache: Dict[str, ParseResult] = {}
+_parse_cache_lock = threading.Lock()
+
+
+def _copy_result(result: ParseResult) -> ParseResult:
+    """Fresh ParseResult/ParsedTrade objects for a cache hit.
+
+    Downstream code fills in defaults on the trade objects, so handing out
+    the cached originals would let one delivery's edits leak into the next.
+    """
+    return ParseResult(
+        trades=[replace(t, missing_fields=list(t.missing_fields))
+                for t in result.trades],
+        raw_message=result.raw_message,
+        success=result.success,
+        error_message=result.error_message,
+    )
+
+
 def parse_message(text: str) -> ParseResult:
     """
     Parse a Telegram message and extract trade information.
 
-    This is the main entry point for parsing.
+    This is the main entry point for parsing. Duplicate messages are
+    served from a small cache instead of re-running the pipeline.
 
     Args:
         text: The raw message text
@@ -119,13 +144,56 @@ def parse_message(text: str) -> ParseResult:
     We try Claude API first because it handles any message format.
     If Claude fails (API error, no key, etc.), we fall back to regex patterns.
     """
+    with _parse_cache_lock:
+        cached = _parse_cache.get(text)
+    if cached is not None:
+        return _copy_result(cached)
+
+    result = _parse_message_uncached(text)
+
+    if result.success:
+        with _parse_cache_lock:
+            if len(_parse_cache) >= _PARSE_CACHE_MAX:
+                _parse_cache.pop(next(iter(_parse_cache)))
+            _parse_cache[text] = _copy_result(result)
+    return result
+
+
+def _is_complete_regex_parse(result: ParseResult) -> bool:
+    """
+    Did the regex pipeline fully parse the message with nothing missing?
+
+    Only high-confidence trades qualify (in practice: the address came
+    from a DEX Screener link, which is unambiguous). Anything weaker goes
+    to Claude, which handles leverage, odd phrasings, and chain guesses
+    better than the patterns do.
+    """
+    return (
+        result.success
+        and bool(result.trades)
+        and all(
+            t.parse_confidence == 'high' and not t.missing_fields
+            for t in result.trades
+        )
+    )
+
+
+def _parse_message_uncached(text: str) -> ParseResult:
+    """Run the actual regex-then-Claude parse pipeline."""
     result = ParseResult(raw_message=text)
 
     if not text or not text.strip():
         result.error_message = "Empty message"
         return result
 
-    # Try Claude API first (if available)
+    # Regex first: it costs microseconds where Claude costs a ~500ms API
+    # round-trip and real money. When it fully parses the message with
+    # high confidence there is nothing the LLM could add.
+    regex_result = parse_message_with_regex(text)
+    if _is_complete_regex_parse(regex_result):
+        return regex_result
+
+    # Otherwise let Claude take a shot (if available)
     if CLAUDE_AVAILABLE:
         try:
             claude_result = parse_with_claude(text)
@@ -137,8 +205,8 @@ def parse_message(text: str) -> ParseResult:
         except Exception as e:
             logging.warning(f"Claude parsing failed, falling back to regex: {e}")
 
-    # Fallback to regex parsing
-    return parse_message_with_regex(text)
+    # Fall back to whatever the regex pass produced
+    return regex_result
 
 
 def convert_claude_to_parsed_trade(claude: 'ClaudeParsedTrade') -> ParsedTrade:
@@ -171,27 +239,55 @@ def parse_message_with_regex(text: str) -> ParseResult:
     """
     result = ParseResult(raw_message=text)
 
-    # Check if this is a perp/futures trade first
-    if is_perp_trade(text):
-        trade = parse_perp_trade(text)
-        result.trades.append(trade)
-        result.success = True
-        return result
+    # Cheap substring probes before any regex work. A C-level 'in' check
+    # costs nanoseconds; the perp/spot/address passes below each scan the
+    # message several times. A false positive here just means the full
+    # path runs as before - the hints only have to be a superset of what
+    # those passes could match. The lowered copy is threaded through the
+    # detectors below so the message is lowered exactly once per parse.
+    # (These hints are the message-shape dispatch: each shape - perp,
+    # CEX spot, address trade, plain chat - only runs its own extractors.
+    # Generating a compiled parser per shape with exec was considered and
+    # skipped; the gates already skip the irrelevant passes, so codegen
+    # would only remove a couple of predictable branches.)
+    t = text.lower()
+    has_deriv_hint = any(k in t for k in (
+        'perp', 'future', 'spot',
+        'hyperliquid', 'hl', 'binance', 'bybit', 'dydx', 'gmx',
+    ))
+    has_address_hint = (
+        '0x' in t
+        or 'dexscreener' in t
+        or any(len(word) >= 32 for word in text.split())
+    )
+
+    # Check if this is a perp/futures trade first. The symbol found here
+    # is handed to parse_perp_trade so the perp patterns run once, not
+    # once for the check and again for the extraction.
+    if has_deriv_hint and not is_spot_trade(text, t):
+        perp_symbol = find_perp_symbol(text)
+        if perp_symbol is not None:
+            trade = parse_perp_trade(text, t, symbol=perp_symbol)
+            result.trades.append(trade)
+            result.success = True
+            return result
 
     # Check if this is a CEX spot trade (e.g., "BTC Spot Binance")
-    cex_spot = extract_cex_spot_info(text)
+    cex_spot = extract_cex_spot_info(text, t) if has_deriv_hint else None
     if cex_spot:
-        trade = parse_cex_spot_trade(text, cex_spot)
+        trade = parse_cex_spot_trade(text, cex_spot, t)
         result.trades.append(trade)
         result.success = True
         return result
 
-    # Step 1: Find all contract addresses
-    addresses = find_all_addresses(text)
+    # Step 1: Find all contract addresses (skipped when nothing in the
+    # message could possibly be one - still falls through to the
+    # sell-by-ticker handling below)
+    addresses = find_all_addresses(text, t) if has_address_hint else []
 
     if not addresses:
         # No addresses found - might be an exit by ticker name
-        trade = parse_single_trade(text, None)
+        trade = parse_single_trade(text, None, t)
         if trade.trade_type == 'SELL' and not trade.contract_address:
             # This might be an exit like "Sold PEPE"
             trade.missing_fields.append("contract_address")
@@ -203,40 +299,45 @@ def parse_message_with_regex(text: str) -> ParseResult:
 
     # Step 2: If multiple addresses, split message and parse each
     if len(addresses) == 1:
-        trade = parse_single_trade(text, addresses[0])
+        trade = parse_single_trade(text, addresses[0], t)
         result.trades.append(trade)
     else:
         # Multiple addresses - try to parse each one
         for chain_info in addresses:
-            trade = parse_single_trade(text, chain_info)
+            trade = parse_single_trade(text, chain_info, t)
             result.trades.append(trade)
 
     result.success = True
     return result
 
 
-def parse_perp_trade(text: str) -> ParsedTrade:
+def parse_perp_trade(
+    text: str,
+    text_lower: Optional[str] = None,
+    symbol: Optional[str] = None,
+) -> ParsedTrade:
     """
     Parse a perp/futures trade message.
 
     These trades don't have contract addresses - just a symbol like "BTC" or "ETH".
+    A symbol already found by find_perp_symbol can be passed in to skip the scan.
     """
     trade = ParsedTrade(raw_message=text)
     trade.is_perp = True
 
     # Extract the symbol and position type
-    perp_info = extract_perp_info(text)
+    perp_info = extract_perp_info(text, text_lower, symbol)
     if perp_info:
         trade.token_symbol, trade.position_type = perp_info
     else:
         trade.missing_fields.append("token_symbol")
 
     # Detect exchange (defaults to hyperliquid for perps)
-    trade.exchange = detect_exchange(text)
+    trade.exchange = detect_exchange(text, text_lower)
     trade.chain = trade.exchange  # For perps, "chain" is the exchange
 
     # Set trade type based on position
-    trade_type = detect_trade_type(text)
+    trade_type = detect_trade_type(text, text_lower)
     if trade_type:
         trade.trade_type = trade_type
     elif trade.position_type == 'SHORT':
@@ -245,9 +346,8 @@ def parse_perp_trade(text: str) -> ParsedTrade:
     else:
         trade.trade_type = 'BUY'  # Longs are like buys
 
-    # Extract amounts
-    usd_amounts = extract_usd_amounts(text)
-    crypto_amounts = extract_crypto_amounts(text)
+    # Extract amounts (one scan covers USD and crypto amounts)
+    usd_amounts, crypto_amounts, _ = extract_amounts(text)
 
     if crypto_amounts:
         trade.amount_spent, trade.spend_currency = crypto_amounts[0]
@@ -267,7 +367,50 @@ def parse_perp_trade(text: str) -> ParsedTrade:
     return trade
 
 
-def find_all_addresses(text: str) -> List[ChainInfo]:
+def parse_cex_spot_trade(
+    text: str,
+    cex_spot: Tuple[str, Optional[str]],
+    text_lower: Optional[str] = None,
+) -> ParsedTrade:
+    """
+    Parse a CEX spot trade message (e.g., "Bought BTC spot on Binance").
+
+    Like perps, these have no contract address - the exchange custodies
+    the tokens - so the trade is tracked by symbol + exchange. The
+    (symbol, exchange) pair comes pre-extracted from extract_cex_spot_info.
+    """
+    trade = ParsedTrade(raw_message=text)
+
+    trade.token_symbol, trade.exchange = cex_spot
+
+    # Like perps, the venue stands in for the chain
+    trade.chain = trade.exchange
+
+    # Spot has no long/short - default to BUY when the verb is missing
+    trade.trade_type = detect_trade_type(text, text_lower) or 'BUY'
+
+    # Extract amounts (one scan covers USD and crypto amounts)
+    usd_amounts, crypto_amounts, _ = extract_amounts(text)
+
+    if crypto_amounts:
+        trade.amount_spent, trade.spend_currency = crypto_amounts[0]
+    elif usd_amounts:
+        trade.amount_spent = usd_amounts[0]
+        trade.spend_currency = 'USD'
+    else:
+        trade.missing_fields.append("amount_spent")
+
+    # Extract notes URL
+    urls = extract_urls(text)
+    if urls:
+        trade.notes_url = urls[0]
+
+    trade.parse_confidence = 'medium'
+
+    return trade
+
+
+def find_all_addresses(text: str, text_lower: Optional[str] = None) -> List[ChainInfo]:
     """
     Find all contract addresses in the message.
     Prioritizes DEX Screener links (most reliable) over raw addresses.
@@ -275,51 +418,65 @@ def find_all_addresses(text: str) -> List[ChainInfo]:
     Returns:
         List of ChainInfo objects with detected addresses
     """
-    addresses = []
+    # One pass of the fused scanner collects every address shape at once
+    # (DEX Screener links, bare EVM addresses, Solana candidates) instead
+    # of three separate regex sweeps over the same message
+    dex_info = []
+    evm_addresses = []
+    sol_addresses = []
+    for m in ADDRESS_SCANNER_PATTERN.finditer(text):
+        if m.group('dex'):
+            dex_info.append((m.group('dex_chain'), m.group('dex_address')))
+        elif m.group('evm'):
+            evm_addresses.append(m.group('evm'))
+        else:
+            sol_addresses.append(m.group('sol'))
 
-    # First, check for DEX Screener links (most reliable source of chain info)
-    dex_info = extract_dexscreener_info(text)
-    for chain, address in dex_info:
-        chain_info = create_chain_info(address, chain=chain, from_dex_link=True)
-        addresses.append(chain_info)
+    # Dedup via one insertion-ordered dict keyed on the lowered address.
+    # setdefault makes first-win explicit: DEX link entries go in first,
+    # so a bare mention of the same address later never downgrades the
+    # chain info. No separate seen-set to keep in sync.
+    seen: dict = {}
 
-    # Keep track of addresses we've already found via DEX links
-    found_addresses = {ci.address.lower() for ci in addresses}
+    # DEX Screener links first (most reliable source of chain info)
+    for chain, address in dex_info:
+        seen.setdefault(
+            address.lower(),
+            create_chain_info(address, chain=chain, from_dex_link=True),
+        )
 
     # Check for EVM addresses
-    evm_addresses = extract_evm_addresses(text)
     text_chain = detect_chain_from_text(text)
 
     for addr in evm_addresses:
-        if addr.lower() not in found_addresses:
-            chain_info = create_chain_info(addr, chain=text_chain)
-            addresses.append(chain_info)
-            found_addresses.add(addr.lower())
+        if addr.lower() not in seen:
+            seen[addr.lower()] = create_chain_info(addr, chain=text_chain)
 
     # Check for Solana addresses
     # Note: Solana address pattern can have false positives, so only add if
     # we have chain context suggesting Solana, or if no EVM addresses found
-    if 'solana' in text.lower() or not evm_addresses:
-        sol_addresses = extract_solana_addresses(text)
+    if 'solana' in (text_lower if text_lower is not None else text.lower()) or not evm_addresses:
+        # The scanner's digit lookahead already rejected word-like
+        # all-letter runs, so no per-candidate post-filtering here
         for addr in sol_addresses:
-            if addr.lower() not in found_addresses:
-                # Extra validation: Solana addresses are usually 32-44 chars
-                # and shouldn't look like words
-                if len(addr) >= 32 and not addr.isalpha():
-                    chain_info = create_chain_info(addr, chain='solana')
-                    addresses.append(chain_info)
-                    found_addresses.add(addr.lower())
+            if addr.lower() not in seen:
+                seen[addr.lower()] = create_chain_info(addr, chain='solana')
 
-    return addresses
+    return list(seen.values())
 
 
-def parse_single_trade(text: str, chain_info: Optional[ChainInfo]) -> ParsedTrade:
+def parse_single_trade(
+    text: str,
+    chain_info: Optional[ChainInfo],
+    text_lower: Optional[str] = None,
+) -> ParsedTrade:
     """
     Parse a message for a single trade.
 
     Args:
         text: The message text
         chain_info: Optional ChainInfo for the contract address
+        text_lower: Optional pre-lowered copy of text (avoids re-lowering)
 
     Returns:
         ParsedTrade with extracted information
@@ -333,16 +490,15 @@ def parse_single_trade(text: str, chain_info: Optional[ChainInfo]) -> ParsedTrad
         trade.parse_confidence = chain_info.confidence
 
     # Detect trade type (BUY or SELL)
-    trade.trade_type = detect_trade_type(text)
+    trade.trade_type = detect_trade_type(text, text_lower)
     if not trade.trade_type:
         # Default to BUY if we have an address (most common case)
         if chain_info:
             trade.trade_type = 'BUY'
         trade.missing_fields.append("trade_type")
 
-    # Extract amounts
-    usd_amounts = extract_usd_amounts(text)
-    crypto_amounts = extract_crypto_amounts(text)
+    # Extract amounts and market cap in one scan
+    usd_amounts, crypto_amounts, trade.market_cap = extract_amounts(text)
 
     if crypto_amounts:
         # Prefer crypto amounts (e.g., "1.5K USDC")
@@ -354,16 +510,11 @@ def parse_single_trade(text: str, chain_info: Optional[ChainInfo]) -> ParsedTrad
     else:
         trade.missing_fields.append("amount_spent")
 
-    # Extract market cap
-    trade.market_cap = extract_market_cap(text)
-
-    # Extract thesis/notes URL
-    urls = extract_urls(text)
+    # Extract thesis/notes URL and DEX Screener link in one pass
+    urls, dex_info = extract_link_info(text)
     if urls:
         trade.notes_url = urls[0]  # Take first non-DEX-Screener URL
 
-    # Check for DEX Screener URL
-    dex_info = extract_dexscreener_info(text)
     if dex_info:
         # Reconstruct the URL
         chain, address = dex_info[0]
@@ -372,6 +523,13 @@ def parse_single_trade(text: str, chain_info: Optional[ChainInfo]) -> ParsedTrad
     return trade
 
 
+def _format_mcap(market_cap: float) -> str:
+    """Format a market cap as $X.XM / $XK for the summary."""
+    if market_cap >= 1_000_000:
+        return f"${market_cap / 1_000_000:.1f}M"
+    return f"${market_cap / 1_000:,.0f}K"
+
+
 def format_parse_summary(result: ParseResult) -> str:
     """
     Create a human-readable summary of what was parsed.
@@ -386,6 +544,24 @@ def format_parse_summary(result: ParseResult) -> str:
     if not result.success:
         return f"Could not parse message: {result.error_message}"
 
+    # Fast path: almost every message yields exactly one trade, so build the
+    # summary as one f-string instead of a list of appends plus a join. Each
+    # optional line collapses to '' when its field is absent.
+    if len(result.trades) == 1:
+        t = result.trades[0]
+        return (
+            f"{'+' if t.trade_type == 'BUY' else '-'} {t.trade_type or 'UNKNOWN'}"
+            + (f"\n  Amount: {t.amount_spent:,.2f} {t.spend_currency or 'USD'}"
+               if t.amount_spent else "")
+            + (f"\n  Token: {t.contract_address[:6]}...{t.contract_address[-4:]}"
+               f" ({t.chain or 'unknown'})"
+               if t.contract_address else "")
+            + (f"\n  Entry MCAP: {_format_mcap(t.market_cap)}"
+               if t.market_cap else "")
+            + (f"\n  Missing: {', '.join(t.missing_fields)}"
+               if t.missing_fields else "")
+        )
+
     lines = []
     for i, trade in enumerate(result.trades, 1):
         if len(result.trades) > 1:
@@ -408,11 +584,7 @@ def format_parse_summary(result: ParseResult) -> str:
 
         # Market cap
         if trade.market_cap:
-            if trade.market_cap >= 1_000_000:
-                mcap_str = f"${trade.market_cap / 1_000_000:.1f}M"
-            else:
-                mcap_str = f"${trade.market_cap / 1_000:,.0f}K"
-            lines.append(f"  Entry MCAP: {mcap_str}")
+            lines.append(f"  Entry MCAP: {_format_mcap(trade.market_cap)}")
 
         # Missing fields warning
         if trade.missing_fields:
@@ -41,7 +41,7 @@ Examples:
 """
 
 import re
-from typing import Optional, List, Tuple
+from typing import Any, Dict, Optional, List, Tuple
 from dataclasses import dataclass
 
 
@@ -52,25 +52,45 @@ from dataclasses import dataclass
 # EVM addresses (Ethereum, Base, BNB, Arbitrum, etc.)
 # Format: 0x followed by exactly 40 hexadecimal characters
 # Example: 0x20DD04c17AFD5c9a8b3f2cdacaa8Ee7907385BEF
-EVM_ADDRESS_PATTERN = re.compile(r'0x[a-fA-F0-9]{40}', re.IGNORECASE)
+# The lookarounds reject matches embedded in longer hex runs, so a 60-char
+# hex blob yields no match at all instead of a bogus 42-char prefix the
+# caller would have to filter out
+EVM_ADDRESS_PATTERN = re.compile(
+    r'(?<![a-fA-F0-9])0x[a-fA-F0-9]{40}(?![a-fA-F0-9])',
+    re.IGNORECASE
+)
 
 # Solana addresses
 # Format: 32-44 base58 characters (no 0, O, I, l to avoid confusion)
 # Example: 7GCihgDB8fe6KNjn2MYtkzZcRjQy3t9GHdC8uHYmW2hr
 # Note: This can match some non-address strings, so we validate via API
-SOLANA_ADDRESS_PATTERN = re.compile(r'[1-9A-HJ-NP-Za-km-z]{32,44}')
+# Same boundary treatment: base58 runs longer than 44 chars are not
+# addresses, so don't carve spurious 44-char matches out of them. The
+# digit lookahead rejects all-letter runs (long words, hashes of words)
+# inside the engine, replacing the old Python-level isalpha() post-filter.
+SOLANA_ADDRESS_PATTERN = re.compile(
+    r'(?<![1-9A-HJ-NP-Za-km-z])(?=[A-HJ-NP-Za-km-z]{0,43}[1-9])'
+    r'[1-9A-HJ-NP-Za-km-z]{32,44}(?![1-9A-HJ-NP-Za-km-z])'
+)
 
 
 # =============================================================================
-# DEX SCREENER LINK PATTERN
+# ADDRESS SCANNER
 # =============================================================================
 
-# Matches DEX Screener URLs and extracts the chain and address
-# Format: https://dexscreener.com/{chain}/{address}
-# Example: https://dexscreener.com/ethereum/0x6982508145454ce325ddbe47a25d4ec3d2311933
-DEXSCREENER_PATTERN = re.compile(
-    r'(?:https?://)?dexscreener\.com/([a-zA-Z0-9_-]+)/([a-zA-Z0-9]+)',
-    re.IGNORECASE
+# All three address shapes fused into one scanner so find_all_addresses
+# walks the message exactly once instead of three times. Alternation order
+# is priority at a given position: a DEX Screener link consumes its
+# embedded address whole, so the bare EVM/Solana branches only fire on
+# standalone addresses. Case-insensitivity is scoped with (?i:...) - the
+# Solana branch must stay case-sensitive or base58's excluded look-alike
+# letters (0, O, I, l) would sneak back in.
+ADDRESS_SCANNER_PATTERN = re.compile(
+    r'(?P<dex>(?i:(?:https?://)?dexscreener\.com)/'
+    r'(?P<dex_chain>[a-zA-Z0-9_-]+)/(?P<dex_address>[a-zA-Z0-9]+))'
+    r'|(?P<evm>(?<![a-fA-F0-9])0x[a-fA-F0-9]{40}(?![a-fA-F0-9]))'
+    r'|(?P<sol>(?<![1-9A-HJ-NP-Za-km-z])(?=[A-HJ-NP-Za-km-z]{0,43}[1-9])'
+    r'[1-9A-HJ-NP-Za-km-z]{32,44}(?![1-9A-HJ-NP-Za-km-z]))'
 )
 
 
@@ -80,8 +100,10 @@ DEXSCREENER_PATTERN = re.compile(
 
 # Dollar amounts with optional K/M suffix
 # Matches: $100, $1,500, $1.5K, $2.3M, $50.50
+# The lookahead keeps the suffix from grabbing the first letter of a
+# following word ("$50 more" is fifty dollars, not fifty million)
 USD_AMOUNT_PATTERN = re.compile(
-    r'\$\s*([\d,]+(?:\.\d+)?)\s*([KkMmBb])?',
+    r'\$\s*([\d,]+(?:\.\d+)?)\s*([KkMmBb](?![A-Za-z]))?',
     re.IGNORECASE
 )
 
@@ -92,14 +114,6 @@ CRYPTO_AMOUNT_PATTERN = re.compile(
     re.IGNORECASE
 )
 
-# Generic number with K/M/B suffix (for market cap, etc.)
-# Matches: 1.5K, 2.3M, 100M, 1B
-NUMBER_WITH_SUFFIX_PATTERN = re.compile(
-    r'([\d,]+(?:\.\d+)?)\s*([KkMmBb])',
-    re.IGNORECASE
-)
-
-
 # =============================================================================
 # MARKET CAP PATTERN
 # =============================================================================
@@ -111,33 +125,44 @@ MARKET_CAP_PATTERN = re.compile(
     re.IGNORECASE
 )
 
-
-# =============================================================================
-# TRADE TYPE PATTERNS
-# =============================================================================
-
-# Keywords indicating a BUY
-BUY_KEYWORDS_PATTERN = re.compile(
-    r'\b(bought|buy|buying|entered|entry|ape|aped|aping|grabbed|sniped|sniping|longed|long|in|added)\b',
-    re.IGNORECASE
-)
-
-# Keywords indicating a SELL
-SELL_KEYWORDS_PATTERN = re.compile(
-    r'\b(sold|sell|selling|exit|exited|exiting|out|dumped|took\s*profit|tp|closed|shorte?d?)\b',
+# Every numeric shape in one scanner: a dollar sign, a number with
+# optional K/M/B suffix, an optional currency token, an optional market
+# cap marker. One pass classifies each number by which optional groups
+# fired, replacing the three separate sweeps the individual patterns
+# above cost per message (they stay exported for targeted use and the
+# test scripts). extract_amounts documents the classification rules.
+# The suffix lookahead stops a K/M/B from eating the first letter of a
+# currency token ("0.5 BTC" is half a bitcoin, not 0.5 billion "TC").
+AMOUNT_SCANNER_PATTERN = re.compile(
+    r'(?:(?P<dollar>\$)\s*)?'
+    r'(?P<num>\d[\d,]*(?:\.\d+)?)\s*'
+    r'(?P<suffix>[KkMmBb](?=$|[^A-Za-z]|ETH|SOL|BTC|USDC|USDT|BNB|MATIC|AVAX|FTM))?'
+    r'\s*(?P<currency>ETH|SOL|BTC|USDC|USDT|BNB|MATIC|AVAX|FTM)?'
+    r'\s*(?P<mcap>mcap|mc|market\s*cap)?',
     re.IGNORECASE
 )
 
 
 # =============================================================================
-# URL PATTERN
+# TRADE TYPE PATTERNS
 # =============================================================================
 
-# General URL pattern for thesis links, etc.
-# Matches most URLs starting with http:// or https://
-URL_PATTERN = re.compile(
-    r'https?://[^\s<>"{}|\\^`\[\]]+',
-    re.IGNORECASE
+# Keywords indicating a BUY.
+#
+# LEARNING MOMENT: The Cost of IGNORECASE
+# re.IGNORECASE makes the C matcher case-fold every character it looks at.
+# The keyword patterns below are all-lowercase literals, so it's cheaper to
+# lower the message once per call and drop the flag - the functions further
+# down do exactly that. Patterns that need the original casing (addresses,
+# [A-Z] symbol captures, URLs) keep their flags.
+_BUY_KEYWORDS = r'bought|buy|buying|entered|entry|ape|aped|aping|grabbed|sniped|sniping|longed|long|in|added'
+_SELL_KEYWORDS = r'sold|sell|selling|exit|exited|exiting|out|dumped|took\s*profit|tp|closed|shorte?d?'
+
+# Both keyword sets in one alternation. detect_trade_type only needs the
+# first hit in the message, so a single search (whose matched group name
+# says which side won) replaces two full scans plus the tie-break rescan.
+TRADE_TYPE_PATTERN = re.compile(
+    r'\b(?:(?P<buy>' + _BUY_KEYWORDS + r')|(?P<sell>' + _SELL_KEYWORDS + r'))\b'
 )
 
 
@@ -160,7 +185,7 @@ PERP_PATTERN = re.compile(
 
 # Common perp trading symbols (tokens commonly traded as perps)
 # These are used when someone just says "ETH Hyperliquid" without "perps"
-COMMON_PERP_SYMBOLS = {
+COMMON_PERP_SYMBOLS = frozenset({
     # Major coins
     'BTC', 'ETH', 'SOL', 'BNB', 'XRP', 'ADA', 'AVAX', 'MATIC', 'DOT', 'LINK',
     # L2s and newer L1s
@@ -173,10 +198,10 @@ COMMON_PERP_SYMBOLS = {
     'JTO', 'JUP', 'PYTH', 'RAY', 'ORCA',
     # Hyperliquid specific
     'HYPE', 'PURR',
-}
+})
 
 # Pattern to detect "Spot" trades (CEX spot, not perps)
-SPOT_PATTERN = re.compile(r'\bspot\b', re.IGNORECASE)
+SPOT_PATTERN = re.compile(r'\bspot\b')  # searched against lowered text
 
 # Pattern to match symbol + exchange (e.g., "ETH Hyperliquid", "BTC on HL")
 SYMBOL_EXCHANGE_PATTERN = re.compile(
@@ -184,24 +209,35 @@ SYMBOL_EXCHANGE_PATTERN = re.compile(
     re.IGNORECASE
 )
 
-# Exchange/platform patterns
-EXCHANGE_PATTERNS = {
-    'hyperliquid': re.compile(r'\b(?:hyperliquid|hl)\b', re.IGNORECASE),
-    'binance': re.compile(r'\b(?:binance|binance\s*futures?|binance\s*perps?)\b', re.IGNORECASE),
-    'bybit': re.compile(r'\b(?:bybit)\b', re.IGNORECASE),
-    'dydx': re.compile(r'\b(?:dydx)\b', re.IGNORECASE),
-    'gmx': re.compile(r'\b(?:gmx)\b', re.IGNORECASE),
-}
+# All exchange keywords fused into one alternation (group name = exchange)
+# so detect_exchange scans the message once instead of once per exchange
+EXCHANGE_SCANNER_PATTERN = re.compile(
+    r'\b(?:'
+    r'(?P<hyperliquid>hyperliquid|hl)'
+    r'|(?P<binance>binance(?:\s*(?:futures?|perps?))?)'
+    r'|(?P<bybit>bybit)'
+    r'|(?P<dydx>dydx)'
+    r'|(?P<gmx>gmx)'
+    r')\b'
+)
 
-# Trade type for perps (long/short)
-LONG_PATTERN = re.compile(r'\b(?:longe?d?|long)\b', re.IGNORECASE)
-SHORT_PATTERN = re.compile(r'\b(?:shorte?d?|short)\b', re.IGNORECASE)
+# Short detection for perps (long is the default when absent)
+SHORT_PATTERN = re.compile(r'\b(?:shorte?d?|short)\b')
 
 
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
 
+# Suffix multipliers for parse_number_with_suffix, built once. Covers
+# both cases directly so the hot path needs no .upper() allocation.
+_SUFFIX_MULTIPLIERS = {
+    'K': 1_000, 'k': 1_000,
+    'M': 1_000_000, 'm': 1_000_000,
+    'B': 1_000_000_000, 'b': 1_000_000_000,
+}
+
+
 def parse_number_with_suffix(value: str, suffix: Optional[str] = None) -> float:
     """
     Parse a number that might have K/M/B suffix.
@@ -223,13 +259,7 @@ def parse_number_with_suffix(value: str, suffix: Optional[str] = None) -> float:
     number = float(clean_value)
 
     if suffix:
-        suffix = suffix.upper()
-        multipliers = {
-            'K': 1_000,
-            'M': 1_000_000,
-            'B': 1_000_000_000,
-        }
-        number *= multipliers.get(suffix, 1)
+        number *= _SUFFIX_MULTIPLIERS.get(suffix, 1)
 
     return number
 
@@ -247,16 +277,6 @@ def extract_solana_addresses(text: str) -> List[str]:
     return SOLANA_ADDRESS_PATTERN.findall(text)
 
 
-def extract_dexscreener_info(text: str) -> List[Tuple[str, str]]:
-    """
-    Extract DEX Screener chain and address from URLs.
-
-    Returns:
-        List of (chain, address) tuples
-    """
-    return DEXSCREENER_PATTERN.findall(text)
-
-
 def extract_usd_amounts(text: str) -> List[float]:
     """
     Extract USD amounts from text.
@@ -300,67 +320,178 @@ def extract_market_cap(text: str) -> Optional[float]:
     return None
 
 
-def detect_trade_type(text: str) -> Optional[str]:
+def extract_amounts(text: str) -> Tuple[List[float], List[Tuple[float, str]], Optional[float]]:
+    """
+    Extract USD amounts, crypto amounts, and market cap in a single pass.
+
+    Classification follows which optional groups fired, mirroring what the
+    three standalone patterns each match on their own:
+    - a currency token makes it a crypto amount ("1.5K USDC")
+    - a dollar sign makes it a USD amount too ("$500 USDC" is both)
+    - an mcap marker sets the market cap, unless a currency intervened
+      (MARKET_CAP_PATTERN never matched across one either)
+    - a bare number classifies as nothing and is skipped
+
+    Returns:
+        (usd_amounts, crypto_amounts, market_cap) matching the outputs of
+        extract_usd_amounts / extract_crypto_amounts / extract_market_cap
+    """
+    usd: List[float] = []
+    crypto: List[Tuple[float, str]] = []
+    market_cap: Optional[float] = None
+    for m in AMOUNT_SCANNER_PATTERN.finditer(text):
+        dollar, value_str, suffix, currency, mcap = m.group(
+            'dollar', 'num', 'suffix', 'currency', 'mcap')
+        if not (dollar or currency or mcap):
+            continue
+        value = parse_number_with_suffix(value_str, suffix)
+        if currency:
+            crypto.append((value, currency.upper()))
+        if dollar:
+            usd.append(value)
+        if mcap and not currency and market_cap is None:
+            market_cap = value
+    return usd, crypto, market_cap
+
+
+def parse_all(text: str) -> Dict[str, Any]:
+    """
+    Run every extractor over a message in one call.
+
+    Convenience driver for scripts and debugging: calling the six
+    extract_* functions separately lowers the message repeatedly and
+    splits the fused scanners' work (extract_amounts already produces
+    USD amounts, crypto amounts and market cap in one scan; the URL
+    scanner produces notes URLs and DEX links together). This shares one
+    lowered copy and each fused scan, so the message is walked a handful
+    of times instead of once per extractor.
+
+    Returns:
+        Dict with the same values the standalone extractors return,
+        keyed by what they extract
+    """
+    text_lower = text.lower()
+    usd_amounts, crypto_amounts, market_cap = extract_amounts(text)
+    urls, dex_links = extract_link_info(text)
+    return {
+        'evm_addresses': extract_evm_addresses(text),
+        'solana_addresses': extract_solana_addresses(text),
+        'trade_type': detect_trade_type(text, text_lower),
+        'usd_amounts': usd_amounts,
+        'crypto_amounts': crypto_amounts,
+        'market_cap': market_cap,
+        'urls': urls,
+        'dex_links': dex_links,
+        'exchange': detect_exchange(text, text_lower),
+    }
+
+
+def detect_trade_type(text: str, text_lower: Optional[str] = None) -> Optional[str]:
     """
     Detect if the message is about buying or selling.
 
+    Callers that already hold a lowered copy of the message can pass it as
+    text_lower to skip re-lowering (same convention for the other
+    case-insensitive detectors below).
+
     Returns:
         'BUY', 'SELL', or None if unclear
     """
-    has_buy = BUY_KEYWORDS_PATTERN.search(text) is not None
-    has_sell = SELL_KEYWORDS_PATTERN.search(text) is not None
-
-    if has_buy and not has_sell:
-        return 'BUY'
-    elif has_sell and not has_buy:
-        return 'SELL'
-    elif has_buy and has_sell:
-        # Both keywords present - check which comes first
-        buy_match = BUY_KEYWORDS_PATTERN.search(text)
-        sell_match = SELL_KEYWORDS_PATTERN.search(text)
-        if buy_match and sell_match:
-            return 'BUY' if buy_match.start() < sell_match.start() else 'SELL'
-    return None
+    if text_lower is None:
+        text_lower = text.lower()
+    # The first keyword in the message decides (same tie-break as before,
+    # when both sides appeared) - one scan instead of two-plus-rescan
+    m = TRADE_TYPE_PATTERN.search(text_lower)
+    if m is None:
+        return None
+    return 'BUY' if m.lastgroup == 'buy' else 'SELL'
+
+
+# DEX Screener links and general URLs in one alternation. The dex branch
+# comes first, so it claims DEX Screener links at their position and the
+# url branch only sees everything else - one scan produces both the
+# notes-URL list and the (chain, address) pairs that used to take two.
+URL_SCANNER_PATTERN = re.compile(
+    r'(?P<dex>(?:https?://)?dexscreener\.com/'
+    r'(?P<link_chain>[a-zA-Z0-9_-]+)/(?P<link_address>[a-zA-Z0-9]+))'
+    r'|(?P<url>https?://[^\s<>"{}|\\^`\[\]]+)',
+    re.IGNORECASE
+)
+
+
+def extract_link_info(text: str) -> Tuple[List[str], List[Tuple[str, str]]]:
+    """
+    Extract notes URLs and DEX Screener links in a single pass.
+
+    Returns:
+        (urls, dex_info) where urls excludes DEX Screener links and
+        dex_info is a list of (chain, address) tuples
+    """
+    urls = []
+    dex_info = []
+    for m in URL_SCANNER_PATTERN.finditer(text):
+        if m.group('dex'):
+            dex_info.append((m.group('link_chain'), m.group('link_address')))
+        else:
+            urls.append(m.group('url'))
+    return urls, dex_info
 
 
 def extract_urls(text: str) -> List[str]:
     """
     Extract all URLs from text (excluding DEX Screener links which are handled separately).
     """
-    all_urls = URL_PATTERN.findall(text)
-    # Filter out DEX Screener links
-    return [url for url in all_urls if 'dexscreener.com' not in url.lower()]
+    return extract_link_info(text)[0]
 
 
-def extract_perp_info(text: str) -> Optional[Tuple[str, str]]:
+def find_perp_symbol(text: str) -> Optional[str]:
     """
-    Extract perp/futures trade info from text.
+    Find the perp trading symbol in a message, or None.
 
-    Returns:
-        Tuple of (symbol, position_type) like ('BTC', 'LONG') or None
+    The single source of the symbol-finding logic: is_perp_trade,
+    extract_perp_info, and the regex pipeline all share this one scan
+    instead of each re-running the same two patterns.
 
     Handles two cases:
     1. Explicit: "BTC perps" or "ETH futures"
     2. Implicit: "ETH Hyperliquid" or "long BTC on HL" (exchange mentioned with symbol)
     """
-    symbol = None
-
     # First, try explicit perp pattern (e.g., "BTC perps")
     match = PERP_PATTERN.search(text)
     if match:
-        symbol = match.group(1).upper()
-    else:
-        # Try symbol + exchange pattern (e.g., "ETH Hyperliquid")
-        match = SYMBOL_EXCHANGE_PATTERN.search(text)
-        if match:
-            potential_symbol = match.group(1).upper()
-            # Only accept if it's a common perp symbol to avoid false positives
-            if potential_symbol in COMMON_PERP_SYMBOLS:
-                symbol = potential_symbol
+        return match.group(1).upper()
+
+    # Try symbol + exchange pattern (e.g., "ETH Hyperliquid")
+    match = SYMBOL_EXCHANGE_PATTERN.search(text)
+    if match:
+        potential_symbol = match.group(1).upper()
+        # Only accept if it's a common perp symbol to avoid false positives
+        if potential_symbol in COMMON_PERP_SYMBOLS:
+            return potential_symbol
+
+    return None
+
+
+def extract_perp_info(
+    text: str,
+    text_lower: Optional[str] = None,
+    symbol: Optional[str] = None,
+) -> Optional[Tuple[str, str]]:
+    """
+    Extract perp/futures trade info from text.
+
+    A caller that already ran find_perp_symbol can pass the result as
+    symbol to skip re-scanning.
+
+    Returns:
+        Tuple of (symbol, position_type) like ('BTC', 'LONG') or None
+    """
+    if symbol is None:
+        symbol = find_perp_symbol(text)
 
     if symbol:
         # Determine if long or short
-        if SHORT_PATTERN.search(text):
+        if SHORT_PATTERN.search(text_lower if text_lower is not None else text.lower()):
             position_type = 'SHORT'
         else:
             position_type = 'LONG'  # Default to long
@@ -369,7 +500,7 @@ def extract_perp_info(text: str) -> Optional[Tuple[str, str]]:
     return None
 
 
-def detect_exchange(text: str) -> Optional[str]:
+def detect_exchange(text: str, text_lower: Optional[str] = None) -> Optional[str]:
     """
     Detect which exchange/platform is mentioned.
 
@@ -377,9 +508,9 @@ def detect_exchange(text: str) -> Optional[str]:
         Exchange name like 'hyperliquid', 'binance', etc. or None
         Defaults to 'hyperliquid' if perps mentioned but no exchange specified.
     """
-    for exchange, pattern in EXCHANGE_PATTERNS.items():
-        if pattern.search(text):
-            return exchange
+    m = EXCHANGE_SCANNER_PATTERN.search(text_lower if text_lower is not None else text.lower())
+    if m:
+        return m.lastgroup
 
     # If perp mentioned but no exchange, default to hyperliquid
     if PERP_PATTERN.search(text):
@@ -388,12 +519,12 @@ def detect_exchange(text: str) -> Optional[str]:
     return None
 
 
-def is_spot_trade(text: str) -> bool:
+def is_spot_trade(text: str, text_lower: Optional[str] = None) -> bool:
     """Check if this is explicitly a spot trade (not perps)."""
-    return SPOT_PATTERN.search(text) is not None
+    return SPOT_PATTERN.search(text_lower if text_lower is not None else text.lower()) is not None
 
 
-def is_perp_trade(text: str) -> bool:
+def is_perp_trade(text: str, text_lower: Optional[str] = None) -> bool:
     """
     Check if this message is about a perp/futures trade.
 
@@ -402,31 +533,20 @@ def is_perp_trade(text: str) -> bool:
     2. Symbol + exchange combo: "ETH Hyperliquid", "BTC on HL" (but NOT if "spot" mentioned)
     """
     # If "spot" is mentioned, it's NOT a perp trade
-    if is_spot_trade(text):
+    if is_spot_trade(text, text_lower):
         return False
 
-    # Check for explicit perp keywords
-    if PERP_PATTERN.search(text):
-        return True
-
-    # Check for symbol + exchange pattern
-    match = SYMBOL_EXCHANGE_PATTERN.search(text)
-    if match:
-        symbol = match.group(1).upper()
-        if symbol in COMMON_PERP_SYMBOLS:
-            return True
-
-    return False
+    return find_perp_symbol(text) is not None
 
 
-def extract_cex_spot_info(text: str) -> Optional[Tuple[str, str]]:
+def extract_cex_spot_info(text: str, text_lower: Optional[str] = None) -> Optional[Tuple[str, str]]:
     """
     Extract CEX spot trade info (e.g., "BTC Spot Binance").
 
     Returns:
         Tuple of (symbol, exchange) like ('BTC', 'binance') or None
     """
-    if not is_spot_trade(text):
+    if not is_spot_trade(text, text_lower):
         return None
 
     # Look for symbol + exchange pattern
@@ -434,7 +554,7 @@ def extract_cex_spot_info(text: str) -> Optional[Tuple[str, str]]:
     if match:
         symbol = match.group(1).upper()
         if symbol in COMMON_PERP_SYMBOLS:  # Reuse the symbol list
-            exchange = detect_exchange(text)
+            exchange = detect_exchange(text, text_lower)
             return (symbol, exchange)
 
     return None
@@ -17,8 +17,11 @@ We use Claude Haiku (the smallest/cheapest model) because:
 Cost estimate: 300 trades/month * $0.00025 = $0.075/month
 """
 
+import hashlib
 import json
-from typing import Optional, Dict, Any
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List
 from dataclasses import dataclass, asdict
 
 import sys
@@ -31,10 +34,23 @@ try:
 except ImportError:
     ANTHROPIC_AVAILABLE = False
 
-from config import ANTHROPIC_API_KEY
+# orjson decodes JSON a few times faster than the stdlib (C scanner, no
+# Python-level hooks); fall back to json.loads when it isn't installed.
+# Same optional-import treatment as in dex_screener.
+try:
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
+from config import settings
 
+ANTHROPIC_API_KEY = settings.anthropic_api_key
 
-@dataclass
+
+# slots=True drops the per-instance __dict__; frozen=True keeps the
+# extraction result a read-only record - the pipeline converts it into
+# its own mutable ParsedTrade and edits that, never this.
+@dataclass(slots=True, frozen=True)
 class ClaudeParsedTrade:
     """Structured trade data extracted by Claude."""
     # Trade type
@@ -64,6 +80,22 @@ class ClaudeParsedTrade:
     raw_message: str = ""
     parse_confidence: str = "high"
 
+    # Short enum-like strings that repeat across trades ('BUY', 'base',
+    # 'hyperliquid', 'USD', ...) - intern them so every trade shares one
+    # object per distinct value instead of a fresh copy out of the JSON
+    # decoder, and downstream == comparisons hit pointer equality first
+    _INTERNED_FIELDS = (
+        'trade_type', 'token_symbol', 'chain', 'venue_type',
+        'exchange', 'position_type', 'amount_currency', 'parse_confidence',
+    )
+
+    def __post_init__(self):
+        for name in self._INTERNED_FIELDS:
+            value = getattr(self, name)
+            if isinstance(value, str):
+                # object.__setattr__ because the class is frozen.
+                object.__setattr__(self, name, sys.intern(value))
+
 
 # The prompt that tells Claude how to parse trade messages
 PARSE_PROMPT = """You are a trade message parser. Extract structured data from trading messages.
@@ -113,10 +145,74 @@ Return a JSON object with these fields:
 Only return the JSON object, no other text."""
 
 
+# Cache of raw Claude responses keyed on a hash of prompt + message.
+# Retries and replays of the same message are common (Telegram redelivers,
+# users re-forward), and the API round-trip is by far the most expensive
+# step in the pipeline - a repeat should cost a dict probe, not an LLM
+# call. Hashing the prompt into the key means editing PARSE_PROMPT
+# invalidates every entry automatically, with no version constant to
+# remember to bump. Only responses that parsed as valid JSON are stored.
+_CLAUDE_CACHE_MAX = 256
+_response_cache: Dict[str, str] = {}
+_response_cache_lock = threading.Lock()
+
+# One Anthropic client for the whole process. The client owns an httpx
+# connection pool, so building it per call threw away the TCP + TLS
+# session on every message and paid the handshakes again. Built lazily
+# under a lock: import must not require an API key (the regex fallback
+# works without one), and parse_many calls in from worker threads.
+_client = None
+_client_lock = threading.Lock()
+
+
+def _get_client():
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = anthropic.Anthropic(
+                    api_key=ANTHROPIC_API_KEY,
+                    max_retries=2,
+                    timeout=30.0,
+                )
+    return _client
+
+
+def _cache_key(message: str) -> str:
+    return hashlib.sha256((PARSE_PROMPT + "\0" + message).encode()).hexdigest()
+
+
+def _trade_from_data(data: Dict[str, Any], message: str) -> ClaudeParsedTrade:
+    """Build a ClaudeParsedTrade from one decoded JSON object."""
+    return ClaudeParsedTrade(
+        trade_type=data.get('trade_type', 'BUY'),
+        token_symbol=data.get('token_symbol'),
+        contract_address=data.get('contract_address'),
+        chain=data.get('chain'),
+        venue_type=data.get('venue_type', 'spot'),
+        exchange=data.get('exchange'),
+        leverage=data.get('leverage'),
+        position_type=data.get('position_type'),
+        amount_value=data.get('amount_value'),
+        amount_currency=data.get('amount_currency'),
+        market_cap=data.get('market_cap'),
+        notes_url=data.get('notes_url'),
+        dex_screener_url=data.get('dex_screener_url'),
+        raw_message=message,
+        parse_confidence='high'
+    )
+
+
 def parse_with_claude(message: str) -> Optional[ClaudeParsedTrade]:
     """
     Parse a trade message using Claude API.
 
+    Deliberately a blocking, whole-response call rather than the
+    streaming API: the bot sends exactly one reply per message, so
+    nothing can act on a partially-parsed trade, and streaming would
+    add incremental-JSON handling for zero user-visible latency win.
+    (The loading indicator in the handler covers the wait.)
+
     Args:
         message: The raw trade message
 
@@ -129,44 +225,39 @@ def parse_with_claude(message: str) -> Optional[ClaudeParsedTrade]:
     if not ANTHROPIC_API_KEY:
         raise ValueError("ANTHROPIC_API_KEY not set in environment")
 
-    client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
+    key = _cache_key(message)
+    with _response_cache_lock:
+        cached_text = _response_cache.get(key)
 
     try:
-        response = client.messages.create(
-            model="claude-3-5-haiku-20241022",  # Cheapest, fastest model
-            max_tokens=500,
-            messages=[
-                {
-                    "role": "user",
-                    "content": f"{PARSE_PROMPT}\n\nMessage to parse:\n{message}"
-                }
-            ]
-        )
-
-        # Extract the JSON from the response
-        response_text = response.content[0].text.strip()
+        if cached_text is not None:
+            response_text = cached_text
+        else:
+            response = _get_client().messages.create(
+                model="claude-3-5-haiku-20241022",  # Cheapest, fastest model
+                max_tokens=500,
+                messages=[
+                    {
+                        "role": "user",
+                        "content": f"{PARSE_PROMPT}\n\nMessage to parse:\n{message}"
+                    }
+                ]
+            )
+
+            # Extract the JSON from the response
+            response_text = response.content[0].text.strip()
 
         # Parse the JSON
-        data = json.loads(response_text)
+        data = _loads(response_text)
+
+        if cached_text is None:
+            with _response_cache_lock:
+                if len(_response_cache) >= _CLAUDE_CACHE_MAX:
+                    _response_cache.pop(next(iter(_response_cache)))
+                _response_cache[key] = response_text
 
         # Convert to our dataclass
-        return ClaudeParsedTrade(
-            trade_type=data.get('trade_type', 'BUY'),
-            token_symbol=data.get('token_symbol'),
-            contract_address=data.get('contract_address'),
-            chain=data.get('chain'),
-            venue_type=data.get('venue_type', 'spot'),
-            exchange=data.get('exchange'),
-            leverage=data.get('leverage'),
-            position_type=data.get('position_type'),
-            amount_value=data.get('amount_value'),
-            amount_currency=data.get('amount_currency'),
-            market_cap=data.get('market_cap'),
-            notes_url=data.get('notes_url'),
-            dex_screener_url=data.get('dex_screener_url'),
-            raw_message=message,
-            parse_confidence='high'
-        )
+        return _trade_from_data(data, message)
 
     except json.JSONDecodeError as e:
         print(f"Failed to parse Claude response as JSON: {e}")
@@ -177,6 +268,96 @@ def parse_with_claude(message: str) -> Optional[ClaudeParsedTrade]:
         return None
 
 
+def parse_with_claude_batch(messages: List[str]) -> List[Optional[ClaudeParsedTrade]]:
+    """
+    Parse several trade messages in one API request.
+
+    LEARNING MOMENT: Amortizing Fixed Costs
+    The parse prompt is ~400 tokens and gets sent with every request, and
+    each request pays a full network round-trip. When importing a backlog
+    (say, a chat history), sending N messages in one request pays the
+    prompt and the round-trip once instead of N times.
+
+    Args:
+        messages: The raw trade messages, in order
+
+    Returns:
+        One ClaudeParsedTrade (or None for entries Claude couldn't parse)
+        per input message, in the same order
+    """
+    if not messages:
+        return []
+
+    if not ANTHROPIC_AVAILABLE:
+        raise ImportError("anthropic package not installed. Run: pip install anthropic")
+
+    if not ANTHROPIC_API_KEY:
+        raise ValueError("ANTHROPIC_API_KEY not set in environment")
+
+    numbered = "\n".join(f"{i}. {msg}" for i, msg in enumerate(messages, 1))
+    prompt = (
+        f"{PARSE_PROMPT}\n\n"
+        f"Parse each of the numbered messages below. Return a JSON array with "
+        f"one object per message, in order (use null for a message that is "
+        f"not a trade).\n\nMessages:\n{numbered}"
+    )
+
+    try:
+        response = _get_client().messages.create(
+            model="claude-3-5-haiku-20241022",
+            # ~500 tokens per parsed object, clamped to the model's 8192
+            # output cap - asking for more gets the request rejected
+            max_tokens=min(500 * len(messages), 8192),
+            messages=[{"role": "user", "content": prompt}]
+        )
+
+        response_text = response.content[0].text.strip()
+        items = _loads(response_text)
+        if not isinstance(items, list):
+            raise ValueError(f"Expected a JSON array, got {type(items).__name__}")
+
+        results: List[Optional[ClaudeParsedTrade]] = []
+        for message, data in zip(messages, items):
+            results.append(_trade_from_data(data, message) if data else None)
+        # If Claude returned fewer objects than messages, pad with None so
+        # the output always lines up with the input
+        results.extend([None] * (len(messages) - len(results)))
+        return results
+
+    except json.JSONDecodeError as e:
+        print(f"Failed to parse Claude batch response as JSON: {e}")
+        print(f"Response was: {response_text}")
+        return [None] * len(messages)
+    except Exception as e:
+        print(f"Claude API error: {e}")
+        return [None] * len(messages)
+
+
+def parse_many(
+    messages: List[str],
+    batch_size: int = 16,
+    max_workers: int = 4,
+) -> List[Optional[ClaudeParsedTrade]]:
+    """
+    Parse a large list of messages using batched, parallel API requests.
+
+    Splits the messages into batches of batch_size and runs up to
+    max_workers batch requests at once, so a big import overlaps its
+    round-trips instead of paying them serially. The default batch size
+    keeps the ~500-tokens-per-object output budget inside the model's
+    8192-token cap (16 * 500 = 8000).
+    """
+    batches = [messages[i:i + batch_size] for i in range(0, len(messages), batch_size)]
+    if len(batches) <= 1:
+        return parse_with_claude_batch(messages)
+
+    results: List[Optional[ClaudeParsedTrade]] = []
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for batch_result in pool.map(parse_with_claude_batch, batches):
+            results.extend(batch_result)
+    return results
+
+
 # Test when running directly
 if __name__ == "__main__":
     test_messages = [
@@ -25,17 +25,68 @@ the limit, you'll get a 429 "Too Many Requests" error.
 """
 
 import requests
-from typing import Optional, Dict, Any, List
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Tuple
 from dataclasses import dataclass
 import time
 
+# orjson is optional (see bot.py): it decodes the raw response bytes in
+# native code, skipping both stdlib json's pure-Python hot loop and the
+# intermediate str that response.json() would build. DEX Screener payloads
+# run 10-50KB of nested pairs, so the decode isn't free.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from config import DEXSCREENER_API_BASE
-
-
-@dataclass
+from config import settings
+
+DEXSCREENER_API_BASE = settings.dexscreener_api_base
+
+# One shared Session for every DEX Screener call.
+#
+# LEARNING MOMENT: Connection Reuse
+# A bare requests.get() opens a TCP connection, does the TLS handshake,
+# makes the request, and throws the connection away - 50-100ms of setup
+# per call that a Session's keep-alive pool pays only once. Sessions are
+# thread-safe for requests, so the to_thread workers all share this one.
+#
+# The Retry policy handles transient failures at the transport layer:
+# up to 3 attempts with 0.3s exponential backoff on 429s and 5xx errors,
+# honoring any Retry-After header the server sends. raise_on_status=False
+# hands the final failing response back instead of raising, so the
+# status-code handling at the call sites (the 429 message, the 404
+# not-found path) keeps working unchanged.
+_RETRY = requests.adapters.Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=["GET"],
+    raise_on_status=False,
+)
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    requests.adapters.HTTPAdapter(
+        pool_connections=10, pool_maxsize=20, max_retries=_RETRY,
+    ),
+)
+
+# (connect, read) timeouts: fail fast when DEX Screener is unreachable,
+# but give a slow response body the full window
+_TIMEOUT = (3.05, 10)
+
+
+# slots=True drops the per-instance __dict__ (~100 bytes each, and these
+# are minted for every pair in every lookup); frozen=True makes instances
+# hashable and guarantees nothing downstream patches a price after the
+# fact - a stale-looking TokenInfo is always a cache entry, never a
+# mutation.
+@dataclass(slots=True, frozen=True)
 class TokenInfo:
     """Information about a token from DEX Screener."""
     contract_address: str
@@ -49,14 +100,37 @@ class TokenInfo:
     price_change_24h: Optional[float]
     dex_url: str
 
+    def __post_init__(self):
+        # chain and symbol repeat across every pair of the same token
+        # ('base', 'PEPE', ...); interning shares one string object and
+        # makes later == checks a pointer compare. object.__setattr__
+        # because the class is frozen. The API can send an explicit
+        # null for either field (which .get(..., 'UNKNOWN') defaults
+        # don't catch), so only intern actual strings.
+        if isinstance(self.chain, str):
+            object.__setattr__(self, 'chain', sys.intern(self.chain))
+        if isinstance(self.symbol, str):
+            object.__setattr__(self, 'symbol', sys.intern(self.symbol))
+
 
 class DexScreenerError(Exception):
     """Custom exception for DEX Screener API errors."""
     pass
 
 
+def _decode_json(response) -> Any:
+    """Decode an API response body, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
 # Chain priority order - lower index = higher priority
 # Solana first for Solana addresses, then Base > BNB > Ethereum for EVM
+# (A sys.intern'd chainId -> priority table was tried and dropped: the
+# selection loop already lowers each chainId exactly once and probes this
+# four-entry dict, so identity-hash interning measured as noise while
+# adding a mutation of the API's pair dicts to carry the interned key.)
 CHAIN_PRIORITY = {
     'solana': 0,
     'base': 1,
@@ -72,6 +146,73 @@ def get_chain_priority(chain_id: str) -> int:
     return CHAIN_PRIORITY.get(chain_id.lower(), DEFAULT_CHAIN_PRIORITY)
 
 
+# ============================================================================
+# PRICE CACHE
+# ============================================================================
+# LEARNING MOMENT: TTL (Time-To-Live) Caching
+# Two /positions calls a few seconds apart re-fetch the exact same prices,
+# and two positions in the same token fetch it twice in one call. Prices
+# don't move meaningfully in 20 seconds, so we remember each answer briefly
+# and serve repeats from memory - zero HTTP requests on a cache hit.
+# The per-key locks give "single-flight" behavior: if two threads ask for
+# the same token at once, one fetches and the other waits for its answer
+# instead of firing a duplicate request.
+#
+# Two variants were considered and skipped:
+# - keying entries by a time bucket (int(time()//TTL)) - expiry-at-read
+#   does the same job without a thundering refetch when a bucket rolls
+#   over, and lets invalidate_cached_price() punch out a single entry;
+# - persisting the cache (shelve/diskcache) across restarts - a price
+#   that survived a redeploy is exactly the stale number we don't want
+#   to show, and a cold cache refills in one /positions call anyway.
+
+_PRICE_CACHE_TTL = 20.0   # seconds a cached price stays valid
+_PRICE_CACHE_MAX = 512    # entries before we start evicting
+
+# (chain, address) -> (expiry time, TokenInfo or None)
+_price_cache: Dict[Tuple[str, str], Tuple[float, Optional[TokenInfo]]] = {}
+_price_cache_lock = threading.Lock()
+_fetch_locks: Dict[Tuple[str, str], threading.Lock] = {}
+
+
+def _cache_key(contract_address: str, chain: Optional[str]) -> Tuple[str, str]:
+    return ((chain or '').lower(), contract_address.lower())
+
+
+def _cache_get(key: Tuple[str, str]) -> Optional[Tuple[float, Optional[TokenInfo]]]:
+    """Return the live cache entry for key, or None if absent/expired."""
+    with _price_cache_lock:
+        entry = _price_cache.get(key)
+    if entry and entry[0] > time.monotonic():
+        return entry
+    return None
+
+
+def _cache_put(key: Tuple[str, str], info: Optional[TokenInfo]) -> None:
+    with _price_cache_lock:
+        if len(_price_cache) >= _PRICE_CACHE_MAX:
+            now = time.monotonic()
+            expired = [k for k, (exp, _) in _price_cache.items() if exp <= now]
+            for k in expired:
+                del _price_cache[k]
+            # Still full means everything is fresh; drop the oldest insert
+            if len(_price_cache) >= _PRICE_CACHE_MAX:
+                del _price_cache[next(iter(_price_cache))]
+        _price_cache[key] = (time.monotonic() + _PRICE_CACHE_TTL, info)
+
+
+def invalidate_cached_price(contract_address: str, chain: Optional[str] = None) -> None:
+    """Drop a cached price so the next lookup hits the API again."""
+    with _price_cache_lock:
+        _price_cache.pop(_cache_key(contract_address, chain), None)
+
+
+def bust_cache() -> None:
+    """Drop every cached price (mainly for tests and manual refresh)."""
+    with _price_cache_lock:
+        _price_cache.clear()
+
+
 def get_token_info(contract_address: str, chain: Optional[str] = None) -> Optional[TokenInfo]:
     """
     Get token information from DEX Screener.
@@ -93,6 +234,25 @@ def get_token_info(contract_address: str, chain: Optional[str] = None) -> Option
     2. Otherwise, use chain priority: Solana > Base > BNB > Ethereum
     3. Within same priority, prefer higher liquidity (more reliable price)
     """
+    key = _cache_key(contract_address, chain)
+    entry = _cache_get(key)
+    if entry:
+        return entry[1]
+
+    # Single-flight: concurrent requests for the same token share one fetch
+    with _price_cache_lock:
+        fetch_lock = _fetch_locks.setdefault(key, threading.Lock())
+    with fetch_lock:
+        entry = _cache_get(key)  # another thread may have just filled it
+        if entry:
+            return entry[1]
+        info = _fetch_token_info(contract_address, chain)
+        _cache_put(key, info)
+        return info
+
+
+def _fetch_token_info(contract_address: str, chain: Optional[str]) -> Optional[TokenInfo]:
+    """The uncached lookup behind get_token_info."""
     # Try to find the token
     pairs = search_token(contract_address, chain)
 
@@ -100,25 +260,29 @@ def get_token_info(contract_address: str, chain: Optional[str] = None) -> Option
         return None
 
     # If user specified a chain, try to find it on that chain first
+    # (lower the hint once, not once per pair in the comprehension)
     if chain:
-        chain_pairs = [p for p in pairs if p.get('chainId', '').lower() == chain.lower()]
+        want = chain.lower()
+        chain_pairs = [p for p in pairs if p.get('chainId', '').lower() == want]
         if chain_pairs:
             # Found on specified chain - use highest liquidity pair on that chain
             best_pair = max(chain_pairs, key=lambda p: p.get('liquidity', {}).get('usd', 0) or 0)
             return parse_pair_to_token_info(best_pair, contract_address)
 
     # No chain specified or not found on specified chain
-    # Sort by: 1) chain priority, 2) liquidity within same priority
+    # Score by: 1) chain priority, 2) liquidity within same priority.
+    # min() finds the best pair in one pass - sorting the whole list just
+    # to take its first element was O(n log n) plus a result-list
+    # allocation, and popular tokens return dozens of pairs.
+    priority_of = CHAIN_PRIORITY.get  # skip the helper call per pair
+
     def pair_score(p):
-        chain_id = p.get('chainId', 'unknown')
-        priority = get_chain_priority(chain_id)
+        priority = priority_of(p.get('chainId', 'unknown').lower(), DEFAULT_CHAIN_PRIORITY)
         liquidity = p.get('liquidity', {}).get('usd', 0) or 0
-        # Return tuple: (priority, -liquidity) so we sort ascending
         # Lower priority number = better, higher liquidity = better
         return (priority, -liquidity)
 
-    pairs_sorted = sorted(pairs, key=pair_score)
-    best_pair = pairs_sorted[0]
+    best_pair = min(pairs, key=pair_score)
 
     return parse_pair_to_token_info(best_pair, contract_address)
 
@@ -137,7 +301,7 @@ def search_token(contract_address: str, chain: Optional[str] = None) -> List[Dic
     url = f"{DEXSCREENER_API_BASE}/latest/dex/tokens/{contract_address}"
 
     try:
-        response = requests.get(url, timeout=10)
+        response = _SESSION.get(url, timeout=_TIMEOUT)
 
         # Handle rate limiting
         if response.status_code == 429:
@@ -148,7 +312,7 @@ def search_token(contract_address: str, chain: Optional[str] = None) -> List[Dic
             return []
 
         response.raise_for_status()
-        data = response.json()
+        data = _decode_json(response)
 
         # API returns 'pairs' array for token search, or direct array for chain search
         if isinstance(data, list):
@@ -164,6 +328,126 @@ def search_token(contract_address: str, chain: Optional[str] = None) -> List[Dic
         raise DexScreenerError(f"Failed to fetch from DEX Screener: {str(e)}")
 
 
+# The multi-token endpoint accepts at most this many addresses per request
+BATCH_ENDPOINT_LIMIT = 30
+
+
+def get_token_infos_batch(chain: str, addresses: List[str]) -> Dict[str, TokenInfo]:
+    """
+    Get token info for many addresses on one chain in a single request.
+
+    LEARNING MOMENT: Batched API Calls
+    DEX Screener's /tokens/v1/{chain}/{addresses} endpoint takes up to 30
+    comma-separated addresses at once. Looking up 20 tokens this way costs
+    one HTTP round-trip instead of 20 - the response time of /positions
+    stops depending on how many positions you hold.
+
+    Args:
+        chain: The chain all these addresses live on
+        addresses: Token contract addresses (any number; chunked internally)
+
+    Returns:
+        Dict mapping lowercased contract address -> TokenInfo. Addresses
+        DEX Screener doesn't know are simply absent from the dict.
+
+    Raises:
+        DexScreenerError: If an API request fails
+    """
+    infos: Dict[str, TokenInfo] = {}
+
+    # Serve what we can from the price cache; only fetch the rest
+    misses: List[str] = []
+    for address in addresses:
+        entry = _cache_get(_cache_key(address, chain))
+        if entry:
+            if entry[1] is not None:
+                infos[address.lower()] = entry[1]
+        elif address not in misses:
+            misses.append(address)
+
+    for start in range(0, len(misses), BATCH_ENDPOINT_LIMIT):
+        chunk = misses[start:start + BATCH_ENDPOINT_LIMIT]
+        url = f"{DEXSCREENER_API_BASE}/tokens/v1/{chain}/{','.join(chunk)}"
+
+        try:
+            response = _SESSION.get(url, timeout=_TIMEOUT)
+
+            if response.status_code == 429:
+                raise DexScreenerError("Rate limited by DEX Screener. Please wait a moment.")
+
+            if response.status_code == 404:
+                continue
+
+            response.raise_for_status()
+            data = _decode_json(response)
+
+        except requests.exceptions.Timeout:
+            raise DexScreenerError("DEX Screener API timed out. Please try again.")
+        except requests.exceptions.RequestException as e:
+            raise DexScreenerError(f"Failed to fetch from DEX Screener: {str(e)}")
+
+        # The endpoint returns a flat list of pairs. A token can appear in
+        # several pools, so keep the most liquid pair per token (same rule
+        # get_token_info applies within a chain).
+        best_pairs: Dict[str, Any] = {}
+        for pair in (data if isinstance(data, list) else []):
+            address = pair.get('baseToken', {}).get('address', '').lower()
+            if not address:
+                continue
+            liquidity = pair.get('liquidity', {}).get('usd', 0) or 0
+            current = best_pairs.get(address)
+            if current is None or liquidity > current[0]:
+                best_pairs[address] = (liquidity, pair)
+
+        for address, (_, pair) in best_pairs.items():
+            infos[address] = parse_pair_to_token_info(pair, address)
+
+        # Cache every address we asked about, including the not-found ones,
+        # so the next /positions within the TTL makes no requests at all
+        for address in chunk:
+            _cache_put(_cache_key(address, chain), infos.get(address.lower()))
+
+    return infos
+
+
+def get_token_info_many(
+    addresses: List[Tuple[str, Optional[str]]],
+    max_workers: int = 8,
+) -> List[Optional[TokenInfo]]:
+    """
+    Look up several (address, chain) pairs concurrently.
+
+    For same-chain batches get_token_infos_batch is still the better
+    tool (one HTTP request for up to 30 addresses); this helper covers
+    mixed-chain lists, where each address needs its own request, by
+    overlapping the round-trips instead of paying them one after
+    another. Cache hits and single-flight dedup still apply per address
+    since each worker just calls get_token_info.
+
+    Returns:
+        One TokenInfo (or None for not-found/failed lookups) per input,
+        in the same order.
+    """
+    if not addresses:
+        return []
+    if len(addresses) == 1:
+        address, chain = addresses[0]
+        try:
+            return [get_token_info(address, chain)]
+        except DexScreenerError:
+            return [None]
+
+    def lookup(item: Tuple[str, Optional[str]]) -> Optional[TokenInfo]:
+        address, chain = item
+        try:
+            return get_token_info(address, chain)
+        except DexScreenerError:
+            return None
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(addresses))) as pool:
+        return list(pool.map(lookup, addresses))
+
+
 def get_pair_info(pair_address: str, chain: str) -> Optional[TokenInfo]:
     """
     Get token info from a pair address (used when parsing DEX Screener URLs).
@@ -176,30 +460,41 @@ def get_pair_info(pair_address: str, chain: str) -> Optional[TokenInfo]:
     When someone shares a DEX Screener link, it usually contains the pair address.
     We need to fetch the pair, then extract the base token info.
     """
+    # Same TTL cache as get_token_info; the 'pair:' prefix keeps pair
+    # addresses from colliding with token addresses on the same chain
+    key = _cache_key('pair:' + pair_address, chain)
+    entry = _cache_get(key)
+    if entry:
+        return entry[1]
+
     url = f"{DEXSCREENER_API_BASE}/latest/dex/pairs/{chain}/{pair_address}"
 
     try:
-        response = requests.get(url, timeout=10)
+        response = _SESSION.get(url, timeout=_TIMEOUT)
 
         if response.status_code == 429:
             raise DexScreenerError("Rate limited by DEX Screener. Please wait a moment.")
 
         if response.status_code == 404:
+            _cache_put(key, None)
             return None
 
         response.raise_for_status()
-        data = response.json()
+        data = _decode_json(response)
 
         # The pairs endpoint returns a 'pair' object directly
         pair = data.get('pair') if isinstance(data, dict) else None
         if not pair:
+            _cache_put(key, None)
             return None
 
         # Extract the base token (the token being traded, not WETH/USDC)
         base_token = pair.get('baseToken', {})
         token_address = base_token.get('address', pair_address)
 
-        return parse_pair_to_token_info(pair, token_address)
+        info = parse_pair_to_token_info(pair, token_address)
+        _cache_put(key, info)
+        return info
 
     except requests.exceptions.Timeout:
         raise DexScreenerError("DEX Screener API timed out. Please try again.")
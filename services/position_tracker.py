@@ -28,8 +28,11 @@ When you sell partial positions, which tokens did you sell?
 We use Average Cost because it's simplest and good enough for a personal journal.
 """
 
-from typing import Optional, Dict, Any, Tuple
+import logging
+from typing import Optional, Dict, Any, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from datetime import datetime
 
 import sys
 from pathlib import Path
@@ -39,6 +42,12 @@ from database import models
 from services.dex_screener import get_token_info, get_pair_info, TokenInfo, DexScreenerError
 from parsing.message_parser import ParsedTrade
 
+# Module-level logger, resolved once at import. The %-style arguments on
+# the calls below are deliberate: the logging module only interpolates
+# them if the record actually passes the level check, so a suppressed
+# INFO line costs a method call instead of an f-string build.
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class TradeResult:
@@ -59,6 +68,72 @@ class TradeResult:
     position_summary: Optional[str] = None
 
 
+def _lookup_token_info(
+    contract_address: str,
+    chain: Optional[str]
+) -> Tuple[Optional[TokenInfo], str]:
+    """
+    Look up a token on DEX Screener, falling back to a pair lookup
+    (DEX Screener URLs use pair addresses, not token addresses).
+
+    Returns:
+        (token_info or None, warning message or "")
+    """
+    try:
+        logger.info("Looking up token: %s on chain: %s", contract_address, chain)
+
+        # First try as token address
+        token_info = get_token_info(contract_address, chain)
+
+        # If not found, try as pair address
+        if not token_info and chain:
+            logger.info("Token not found, trying as pair address...")
+            token_info = get_pair_info(contract_address, chain)
+
+        if token_info:
+            logger.info("Found token: %s @ $%s", token_info.symbol, token_info.price_usd)
+        else:
+            logger.warning("Token not found on DEX Screener")
+        return token_info, ""
+    except Exception as e:
+        # Continue without price - we'll save what we can
+        logger.error("DEX Screener lookup failed: %s: %s", type(e).__name__, e)
+        return None, f"Warning: Could not fetch price - {e}"
+
+
+def _ensure_position(
+    token_id: int,
+    trade_type: str,
+    symbol: Optional[str],
+    chain: Optional[str],
+    contract_address: Optional[str],
+    display_name: str
+) -> Tuple[Dict[str, Any], str]:
+    """
+    Find the open position for a token, creating one if there is none.
+
+    Shared by the spot and perp/CEX paths, which used to carry identical
+    20-line blocks for this. create_position returns the inserted row
+    (RETURNING *), so the create branch no longer re-fetches what it
+    just wrote.
+
+    Returns:
+        (position row, message) - message is non-empty only for a
+        sell with no position to match against
+    """
+    position = models.get_open_position(token_id)
+    message = ""
+    if not position:
+        if trade_type != 'BUY':
+            message = (f"No open position found for {display_name}. "
+                       "Recording trade anyway.")
+        position = models.create_position(
+            token_id, symbol=symbol, chain=chain,
+            contract_address=contract_address
+        )
+    return position, message
+
+
 def process_trade(parsed: ParsedTrade) -> TradeResult:
     """
     Process a parsed trade: save to database and update position.
@@ -77,7 +152,6 @@ def process_trade(parsed: ParsedTrade) -> TradeResult:
     3. CEX spot trades: No contract address, use symbol + exchange
     """
     result = TradeResult(success=False)
-    import logging
 
     if not parsed.trade_type:
         parsed.trade_type = 'BUY'  # Default to buy
@@ -94,26 +168,9 @@ def process_trade(parsed: ParsedTrade) -> TradeResult:
         return result
 
     # Step 1: Look up token info from DEX Screener
-    token_info = None
-    try:
-        logging.info(f"Looking up token: {parsed.contract_address} on chain: {parsed.chain}")
-
-        # First try as token address
-        token_info = get_token_info(parsed.contract_address, parsed.chain)
-
-        # If not found, try as pair address (DEX Screener URLs use pair addresses)
-        if not token_info and parsed.chain:
-            logging.info(f"Token not found, trying as pair address...")
-            token_info = get_pair_info(parsed.contract_address, parsed.chain)
-
-        if token_info:
-            logging.info(f"Found token: {token_info.symbol} @ ${token_info.price_usd}")
-        else:
-            logging.warning(f"Token not found on DEX Screener")
-    except Exception as e:
-        # Continue without price - we'll save what we can
-        logging.error(f"DEX Screener lookup failed: {type(e).__name__}: {e}")
-        result.message = f"Warning: Could not fetch price - {e}"
+    token_info, warning = _lookup_token_info(parsed.contract_address, parsed.chain)
+    if warning:
+        result.message = warning
 
     # Step 2: Get or create token in database
     chain = parsed.chain
@@ -140,22 +197,13 @@ def process_trade(parsed: ParsedTrade) -> TradeResult:
     result.token_symbol = symbol
 
     # Step 3: Find or create position
-    position = models.get_open_position(token_id)
-
-    if parsed.trade_type == 'BUY':
-        if not position:
-            position_id = models.create_position(token_id)
-            position = models.get_position_by_id(position_id)
-        else:
-            position_id = position['id']
-    else:  # SELL
-        if not position:
-            result.message = f"No open position found for {symbol or parsed.contract_address}. Recording trade anyway."
-            position_id = models.create_position(token_id)
-            position = models.get_position_by_id(position_id)
-        else:
-            position_id = position['id']
-
+    position, position_message = _ensure_position(
+        token_id, parsed.trade_type, symbol, chain,
+        parsed.contract_address, symbol or parsed.contract_address
+    )
+    if position_message:
+        result.message = position_message
+    position_id = position['id']
     result.position_id = position_id
 
     # Step 4: Calculate token amount if we have price
@@ -195,16 +243,17 @@ def process_trade(parsed: ParsedTrade) -> TradeResult:
     result.trade_id = trade_id
 
     # Step 6: Update position
+    # Step 7: Generate position summary - from the in-memory totals the
+    # update just computed, not a read-back of the row we just wrote
     if position and amount_tokens and total_value_usd:
-        update_position_from_trade(
+        updated_position = update_position_from_trade(
             position=position,
             trade_type=parsed.trade_type,
             amount_tokens=amount_tokens,
             total_value_usd=total_value_usd
         )
-
-    # Step 7: Generate position summary
-    updated_position = models.get_position_by_id(position_id)
+    else:
+        updated_position = _position_state(position) if position else None
     if updated_position:
         result.position_summary = format_position_summary(updated_position)
 
@@ -251,22 +300,12 @@ def process_perp_or_cex_trade(parsed: ParsedTrade, result: TradeResult) -> Trade
     )
 
     # Find or create position
-    position = models.get_open_position(token_id)
-
-    if parsed.trade_type == 'BUY':
-        if not position:
-            position_id = models.create_position(token_id)
-            position = models.get_position_by_id(position_id)
-        else:
-            position_id = position['id']
-    else:  # SELL
-        if not position:
-            result.message = f"No open position found for {symbol}. Recording trade anyway."
-            position_id = models.create_position(token_id)
-            position = models.get_position_by_id(position_id)
-        else:
-            position_id = position['id']
-
+    position, position_message = _ensure_position(
+        token_id, parsed.trade_type, symbol, chain, synthetic_address, symbol
+    )
+    if position_message:
+        result.message = position_message
+    position_id = position['id']
     result.position_id = position_id
 
     # For perps/CEX, we track in USD value (no token amount)
@@ -297,17 +336,17 @@ def process_perp_or_cex_trade(parsed: ParsedTrade, result: TradeResult) -> Trade
 
     result.trade_id = trade_id
 
-    # Update position
+    # Update position, then summarize from the returned in-memory totals
+    # (no read-back of the row we just wrote)
     if position and amount_tokens and total_value_usd:
-        update_position_from_trade(
+        updated_position = update_position_from_trade(
             position=position,
             trade_type=parsed.trade_type,
             amount_tokens=amount_tokens,
             total_value_usd=total_value_usd
         )
-
-    # Generate position summary
-    updated_position = models.get_position_by_id(position_id)
+    else:
+        updated_position = _position_state(position) if position else None
     if updated_position:
         result.position_summary = format_position_summary(updated_position)
 
@@ -318,15 +357,333 @@ def process_perp_or_cex_trade(parsed: ParsedTrade, result: TradeResult) -> Trade
     return result
 
 
+def process_trades_bulk(parsed_list: List[ParsedTrade]) -> List[TradeResult]:
+    """
+    Process many parsed trades with batched lookups and database writes.
+
+    process_trade issues 5-7 database statements per trade, each paying
+    its own commit; on a multi-trade message or an import that per-trade
+    cost dominates. This path does the same work in batches:
+
+      1. one DEX Screener lookup per UNIQUE contract (repeat addresses -
+         averaging into the same token - hit the local dict)
+      2. one transaction upserting every token (get_or_create_tokens_bulk)
+      3. one SELECT resolving all open positions, plus one transaction
+         creating the missing ones
+      4. one executemany inserting every trade row
+      5. one executemany writing each touched position's final totals
+
+    Between steps 3 and 5 the trades are replayed IN ORDER against
+    in-memory position state, so average-cost PnL comes out identical to
+    calling process_trade once per trade. (Summing buy/sell deltas per
+    position would not: a sell's realized PnL depends on the cost basis
+    at the moment it happens.)
+
+    Note: executemany can't hand back rowids, so TradeResult.trade_id
+    stays None on this path; nothing downstream displays it.
+
+    A struct-of-arrays batch (numpy columns instead of ParsedTrade
+    objects) was considered for imports and skipped along with the Numba
+    kernel (see _apply_trade): per-trade Python overhead is microseconds
+    against the milliseconds of HTTP and SQLite work batched here, and a
+    second trade representation would split every downstream function
+    into two code paths.
+
+    Args:
+        parsed_list: ParsedTrades from the message parser, in order
+
+    Returns:
+        One TradeResult per input, in the same order
+    """
+    results: List[TradeResult] = []
+    pending: List[Dict[str, Any]] = []
+
+    # Step 1: validate each trade and resolve token info, deduping lookups.
+    # The unique contracts are fetched concurrently first: each lookup is
+    # an HTTPS round-trip (~200ms) during which the GIL is released, so a
+    # thread per contract overlaps the waits instead of adding them up.
+    # The shared pooled session in dex_screener keeps connections alive
+    # across threads, and its TTL cache absorbs repeats across batches.
+    unique_keys = []
+    seen_keys = set()
+    for parsed in parsed_list:
+        if (parsed.is_perp or (parsed.exchange and not parsed.contract_address)
+                or not parsed.contract_address):
+            continue
+        key = (parsed.contract_address, parsed.chain)
+        if key not in seen_keys:
+            seen_keys.add(key)
+            unique_keys.append(key)
+
+    lookups: Dict[tuple, Tuple[Optional[TokenInfo], str]] = {}
+    if len(unique_keys) > 1:
+        with ThreadPoolExecutor(max_workers=min(16, len(unique_keys))) as pool:
+            lookups = dict(zip(
+                unique_keys,
+                pool.map(lambda key: _lookup_token_info(*key), unique_keys)
+            ))
+
+    for parsed in parsed_list:
+        result = TradeResult(success=False)
+        results.append(result)
+
+        if not parsed.trade_type:
+            parsed.trade_type = 'BUY'  # Default to buy
+        result.trade_type = parsed.trade_type
+
+        venue_message = None
+        if parsed.is_perp or (parsed.exchange and not parsed.contract_address):
+            # Perp/CEX trade: synthetic address, exchange as chain
+            # (same convention as process_perp_or_cex_trade)
+            symbol = parsed.token_symbol or 'UNKNOWN'
+            exchange = parsed.exchange or 'unknown'
+            address = f"{symbol}_{exchange}"
+            chain = exchange
+            name = f"{symbol} {'Perp' if parsed.is_perp else 'Spot'} on {exchange.title()}"
+            token_info = None
+
+            total_value_usd = (parsed.amount_spent
+                               if parsed.spend_currency in ('USD', 'USDC', 'USDT')
+                               else None)
+            amount_tokens = total_value_usd  # Position size in USD
+            price_usd = 1.0
+            market_cap = None
+            dex_url = None
+            venue_type = "perp" if parsed.is_perp else "spot"
+            venue_message = f"{symbol} {venue_type} on {exchange.title()} recorded"
+
+        elif not parsed.contract_address:
+            result.message = "No contract address found"
+            continue
+
+        else:
+            address = parsed.contract_address
+            key = (address, parsed.chain)
+            if key not in lookups:
+                lookups[key] = _lookup_token_info(address, parsed.chain)
+            token_info, warning = lookups[key]
+            if warning:
+                result.message = warning
+
+            chain = parsed.chain
+            symbol = parsed.token_symbol
+            name = None
+            if token_info:
+                chain = token_info.chain
+                symbol = token_info.symbol
+                name = token_info.name
+                result.price_usd = token_info.price_usd
+                result.market_cap = token_info.market_cap
+            if not chain:
+                chain = 'unknown'
+
+            amount_tokens = None
+            total_value_usd = None
+            if (parsed.amount_spent and token_info and token_info.price_usd
+                    and parsed.spend_currency in ('USD', 'USDC', 'USDT', 'DAI')):
+                amount_tokens = parsed.amount_spent / token_info.price_usd
+                total_value_usd = parsed.amount_spent
+            price_usd = token_info.price_usd if token_info else None
+            market_cap = parsed.market_cap or (token_info.market_cap if token_info else None)
+            dex_url = parsed.dex_screener_url or (token_info.dex_url if token_info else None)
+
+        result.token_symbol = symbol
+        result.amount_spent = parsed.amount_spent
+        result.spend_currency = parsed.spend_currency
+        result.amount_tokens = amount_tokens
+
+        pending.append({
+            'parsed': parsed, 'result': result,
+            'address': address, 'chain': chain, 'symbol': symbol, 'name': name,
+            'amount_tokens': amount_tokens, 'total_value_usd': total_value_usd,
+            'price_usd': price_usd, 'market_cap': market_cap,
+            'dex_url': dex_url, 'venue_message': venue_message,
+        })
+
+    if not pending:
+        return results
+
+    # Step 2: one transaction resolves every token id
+    token_rows = []
+    seen = set()
+    for item in pending:
+        key = (item['address'], item['chain'])
+        if key not in seen:
+            seen.add(key)
+            token_rows.append((item['address'], item['chain'],
+                               item['symbol'], item['name']))
+    token_ids = models.get_or_create_tokens_bulk(token_rows)
+
+    # Step 3: one SELECT for existing open positions, one transaction for
+    # the tokens that have none yet
+    states: Dict[int, Dict[str, Any]] = {
+        token_id: _position_state(row)
+        for token_id, row in models.get_open_positions_for_tokens(
+            list(token_ids.values())
+        ).items()
+    }
+
+    missing: Dict[int, tuple] = {}
+    for item in pending:
+        token_id = token_ids[(item['address'], item['chain'])]
+        if token_id not in states and token_id not in missing:
+            missing[token_id] = (token_id, item['symbol'], item['chain'],
+                                 item['address'])
+            if item['parsed'].trade_type != 'BUY':
+                item['result'].message = (
+                    f"No open position found for {item['symbol'] or item['address']}. "
+                    "Recording trade anyway."
+                )
+
+    new_ids = models.create_positions_bulk(list(missing.values()))
+    for (token_id, symbol, _chain, _address), position_id in zip(missing.values(), new_ids):
+        states[token_id] = {
+            'id': position_id, 'symbol': symbol, 'status': 'OPEN',
+            'total_bought': 0, 'total_sold': 0, 'remaining_tokens': 0,
+            'total_cost_usd': 0, 'total_proceeds_usd': 0, 'realized_pnl_usd': 0,
+            'avg_cost_usd': None,
+        }
+
+    # Steps 4+5: replay trades in order against the in-memory states,
+    # collecting rows for the two batched writes
+    trade_rows = []
+    touched: Dict[int, Dict[str, Any]] = {}
+    now = datetime.now()
+
+    for item in pending:
+        parsed = item['parsed']
+        result = item['result']
+        token_id = token_ids[(item['address'], item['chain'])]
+        state = states[token_id]
+
+        # A trade may have closed this position earlier in the batch.
+        # The serial path never matches a closed position
+        # (get_open_position filters to OPEN/PARTIAL), so mirror it:
+        # open a fresh one instead of reopening the closed row, which
+        # would blend the old cost basis into the new entry.
+        if state['status'] == 'CLOSED':
+            if parsed.trade_type != 'BUY':
+                result.message = (
+                    f"No open position found for {item['symbol'] or item['address']}. "
+                    "Recording trade anyway."
+                )
+            state = _position_state(models.create_position(
+                token_id, symbol=item['symbol'], chain=item['chain'],
+                contract_address=item['address']
+            ))
+            states[token_id] = state
+
+        result.position_id = state['id']
+
+        trade_rows.append((
+            token_id, parsed.trade_type, state['id'], None,
+            parsed.amount_spent, parsed.spend_currency, item['amount_tokens'],
+            item['price_usd'], item['total_value_usd'], item['market_cap'],
+            parsed.raw_message, parsed.notes_url, item['dex_url'], now
+        ))
+
+        if item['amount_tokens'] and item['total_value_usd']:
+            _apply_trade(state, parsed.trade_type,
+                         item['amount_tokens'], item['total_value_usd'])
+            touched[state['id']] = state
+
+        result.position_summary = format_position_summary(state)
+        result.success = True
+        if item['venue_message']:
+            result.message = item['venue_message']
+        elif not result.message:
+            result.message = "Trade recorded successfully"
+
+    models.create_trades_bulk(trade_rows)
+    models.update_positions_bulk([
+        (state['total_bought'], state['total_sold'], state['remaining_tokens'],
+         state['total_cost_usd'], state['total_proceeds_usd'],
+         state['realized_pnl_usd'], state['avg_cost_usd'],
+         state['status'], state['status'], position_id)
+        for position_id, state in touched.items()
+    ])
+
+    return results
+
+
+def _position_state(position: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a position row into a plain mutable dict of its totals."""
+    return {
+        'id': position['id'],
+        'symbol': position['symbol'],
+        'status': position['status'] or 'OPEN',
+        'total_bought': position['total_bought'] or 0,
+        'total_sold': position['total_sold'] or 0,
+        'remaining_tokens': position['remaining_tokens'] or 0,
+        'total_cost_usd': position['total_cost_usd'] or 0,
+        'total_proceeds_usd': position['total_proceeds_usd'] or 0,
+        'realized_pnl_usd': position['realized_pnl_usd'] or 0,
+        'avg_cost_usd': position['avg_cost_usd'],
+    }
+
+
+def _apply_trade(
+    state: Dict[str, Any],
+    trade_type: str,
+    amount_tokens: float,
+    total_value_usd: float
+) -> None:
+    """
+    Apply one trade to a position's totals, in place. Pure math, no
+    database - the caller decides when to persist the state.
+
+    A Numba-compiled numpy kernel was considered for the bulk replay and
+    skipped: even a multi-year import is thousands of trades, and this
+    handful of float ops per trade runs in low milliseconds for that -
+    the import's time goes to HTTP lookups and SQLite writes, which a
+    JIT doesn't touch. Not worth a native dependency plus a first-call
+    compile pause measured in seconds.
+    """
+    if trade_type == 'BUY':
+        state['total_bought'] += amount_tokens
+        state['remaining_tokens'] += amount_tokens
+        state['total_cost_usd'] += total_value_usd
+        # Refresh the cached cost basis: buys are the only thing that
+        # changes it, so sells and display paths just read it back
+        state['avg_cost_usd'] = state['total_cost_usd'] / state['total_bought']
+        state['status'] = 'OPEN'
+
+    else:  # SELL
+        state['total_sold'] += amount_tokens
+        state['remaining_tokens'] -= amount_tokens
+        state['total_proceeds_usd'] += total_value_usd
+
+        # Calculate realized PnL using average cost basis (cached on the
+        # position; the division only runs for rows predating the cache)
+        if state['total_bought'] > 0:
+            avg_cost_per_token = state['avg_cost_usd']
+            if avg_cost_per_token is None:
+                avg_cost_per_token = state['total_cost_usd'] / state['total_bought']
+            cost_of_sold = amount_tokens * avg_cost_per_token
+            state['realized_pnl_usd'] += total_value_usd - cost_of_sold
+
+        # Determine new status
+        if state['remaining_tokens'] <= 0:
+            state['status'] = 'CLOSED'
+            state['remaining_tokens'] = 0  # Prevent negative
+        else:
+            state['status'] = 'PARTIAL'
+
+
 def update_position_from_trade(
     position: Dict[str, Any],
     trade_type: str,
     amount_tokens: float,
     total_value_usd: float
-) -> None:
+) -> Dict[str, Any]:
     """
     Update a position's totals after a trade.
 
+    Returns the updated totals as a dict, so callers can format the
+    position summary from memory instead of re-reading the row they just
+    wrote. The database write stays authoritative; only the read-back is
+    skipped.
+
     LEARNING MOMENT: Average Cost Basis
     When you buy multiple times, your cost basis is the average:
     - Buy 100 tokens for $10 ($0.10 each)
@@ -335,71 +692,40 @@ def update_position_from_trade(
 
     When you sell, we use this average to calculate profit.
     """
-    position_id = position['id']
-    current_bought = position['total_bought'] or 0
-    current_sold = position['total_sold'] or 0
-    current_remaining = position['remaining_tokens'] or 0
-    current_cost = position['total_cost_usd'] or 0
-    current_proceeds = position['total_proceeds_usd'] or 0
-    current_pnl = position['realized_pnl_usd'] or 0
-
-    if trade_type == 'BUY':
-        new_bought = current_bought + amount_tokens
-        new_remaining = current_remaining + amount_tokens
-        new_cost = current_cost + total_value_usd
-
-        models.update_position(
-            position_id=position_id,
-            total_bought=new_bought,
-            remaining_tokens=new_remaining,
-            total_cost_usd=new_cost,
-            status='OPEN'
-        )
-
-    else:  # SELL
-        new_sold = current_sold + amount_tokens
-        new_remaining = current_remaining - amount_tokens
-        new_proceeds = current_proceeds + total_value_usd
-
-        # Calculate realized PnL using average cost basis
-        if current_bought > 0:
-            avg_cost_per_token = current_cost / current_bought
-            cost_of_sold = amount_tokens * avg_cost_per_token
-            realized_pnl = total_value_usd - cost_of_sold
-            new_pnl = current_pnl + realized_pnl
-        else:
-            new_pnl = current_pnl
-
-        # Determine new status
-        if new_remaining <= 0:
-            status = 'CLOSED'
-            new_remaining = 0  # Prevent negative
-        else:
-            status = 'PARTIAL'
-
-        models.update_position(
-            position_id=position_id,
-            total_sold=new_sold,
-            remaining_tokens=new_remaining,
-            total_proceeds_usd=new_proceeds,
-            realized_pnl_usd=new_pnl,
-            status=status
-        )
+    state = _position_state(position)
+    _apply_trade(state, trade_type, amount_tokens, total_value_usd)
+
+    models.update_position(
+        position_id=state['id'],
+        total_bought=state['total_bought'],
+        total_sold=state['total_sold'],
+        remaining_tokens=state['remaining_tokens'],
+        total_cost_usd=state['total_cost_usd'],
+        total_proceeds_usd=state['total_proceeds_usd'],
+        realized_pnl_usd=state['realized_pnl_usd'],
+        avg_cost_usd=state['avg_cost_usd'],
+        status=state['status']
+    )
+    return state
 
 
 def format_position_summary(position: Dict[str, Any]) -> str:
     """Format a position for display."""
-    symbol = position.get('symbol', 'UNKNOWN')
-    status = position.get('status', 'UNKNOWN')
-    remaining = position.get('remaining_tokens', 0) or 0
-    total_cost = position.get('total_cost_usd', 0) or 0
-    total_bought = position.get('total_bought', 0) or 0
-    realized_pnl = position.get('realized_pnl_usd', 0) or 0
+    symbol = position['symbol'] or 'UNKNOWN'
+    status = position['status'] or 'UNKNOWN'
+    remaining = position['remaining_tokens'] or 0
+    total_cost = position['total_cost_usd'] or 0
+    total_bought = position['total_bought'] or 0
+    realized_pnl = position['realized_pnl_usd'] or 0
 
     lines = [f"Position: {symbol} ({status})"]
 
     if remaining > 0 and total_bought > 0:
-        avg_cost = total_cost / total_bought
+        # Cost basis is cached on the row (maintained on every BUY);
+        # the division is only a fallback for rows predating the cache
+        avg_cost = position['avg_cost_usd']
+        if avg_cost is None:
+            avg_cost = total_cost / total_bought
         lines.append(f"Holding: {remaining:,.0f} tokens")
         lines.append(f"Avg cost: ${avg_cost:.6f}")
 
@@ -428,10 +754,10 @@ def find_position_for_exit(symbol: str) -> Tuple[Optional[Dict[str, Any]], str]:
     # Multiple positions - ask user to clarify
     lines = [f"Multiple open positions for {symbol}:"]
     for i, pos in enumerate(positions, 1):
-        addr = pos.get('contract_address', '')
+        addr = pos['contract_address'] or ''
         short_addr = f"{addr[:6]}...{addr[-4:]}" if addr else 'N/A'
-        chain = pos.get('chain', 'unknown')
-        remaining = pos.get('remaining_tokens', 0)
+        chain = pos['chain'] or 'unknown'
+        remaining = pos['remaining_tokens'] or 0
         lines.append(f"{i}. {short_addr} ({chain}) - {remaining:,.0f} tokens")
 
     lines.append("\nPlease specify which position by including the contract address.")
@@ -440,29 +766,32 @@ def find_position_for_exit(symbol: str) -> Tuple[Optional[Dict[str, Any]], str]:
 
 
 def get_portfolio_summary() -> str:
-    """Generate a summary of all open positions."""
+    """
+    Generate a summary of all open positions.
+
+    The totals come from one SQL aggregate row (get_portfolio_totals)
+    rather than a Python accumulation loop plus a separate stats query -
+    this loop only formats the per-position display lines.
+    """
     positions = models.get_all_open_positions()
 
     if not positions:
         return "No open positions."
 
+    totals = models.get_portfolio_totals()
+
     lines = ["Open Positions:"]
     lines.append("-" * 30)
 
-    total_cost = 0
     for pos in positions:
-        symbol = pos.get('symbol', 'UNKNOWN')
-        chain = pos.get('chain', '?')
-        remaining = pos.get('remaining_tokens', 0) or 0
-        cost = pos.get('total_cost_usd', 0) or 0
-
-        total_cost += cost
+        symbol = pos['symbol'] or 'UNKNOWN'
+        chain = pos['chain'] or '?'
+        remaining = pos['remaining_tokens'] or 0
+        cost = pos['total_cost_usd'] or 0
         lines.append(f"{symbol} ({chain}): {remaining:,.0f} tokens, ${cost:,.2f} invested")
 
     lines.append("-" * 30)
-    lines.append(f"Total invested: ${total_cost:,.2f}")
-
-    stats = models.get_trading_stats()
-    lines.append(f"Total realized PnL: ${stats['realized_pnl_usd']:,.2f}")
+    lines.append(f"Total invested: ${totals['total_invested_usd']:,.2f}")
+    lines.append(f"Total realized PnL: ${totals['realized_pnl_usd']:,.2f}")
 
     return "\n".join(lines)
@@ -4,18 +4,45 @@
 from parsing.message_parser import parse_message
 
 # Direct DEX Screener API call (bypassing config)
+import json
+
 import requests
 
+try:
+    from orjson import loads as _loads  # ~3x faster on the nested pairs payload
+except ImportError:
+    _loads = json.loads
+
+# Module-level session, same reason services/dex_screener.py has one:
+# keep-alive reuses the TCP+TLS connection across calls instead of
+# re-handshaking per request (requests already asks for gzip by default,
+# so the payload comes compressed either way).
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    requests.adapters.HTTPAdapter(pool_connections=10, pool_maxsize=20),
+)
+
+
 def get_token_info_direct(contract_address):
     """Direct API call without config dependency."""
     url = f"https://api.dexscreener.com/latest/dex/tokens/{contract_address}"
-    response = requests.get(url, timeout=10)
-    data = response.json()
+    response = _SESSION.get(url, timeout=10)
+    # Decode the raw bytes - skips the intermediate str response.json() builds
+    data = _loads(response.content)
     pairs = data.get('pairs', [])
     if not pairs:
         return None
-    # Get best pair by liquidity
-    best = max(pairs, key=lambda p: p.get('liquidity', {}).get('usd', 0) or 0)
+    # Get best pair by liquidity. A manual loop instead of max(key=...):
+    # no lambda call per pair, and the liquidity extraction happens once
+    # per element as a plain float compare.
+    best = None
+    best_liq = -1.0
+    for p in pairs:
+        liq = (p.get('liquidity') or {}).get('usd') or 0.0
+        if liq > best_liq:
+            best_liq = liq
+            best = p
     return best
 
 test_message = """0x20DD04c17AFD5c9a8b3f2cdacaa8Ee7907385BEF
@@ -2,14 +2,7 @@
 """Quick test script to verify parsing works."""
 
 from parsing.message_parser import parse_message, format_parse_summary
-from parsing.patterns import (
-    extract_evm_addresses,
-    extract_usd_amounts,
-    extract_crypto_amounts,
-    extract_market_cap,
-    detect_trade_type,
-    extract_urls,
-)
+from parsing.patterns import parse_all
 
 # Your example message
 test_message = """0x20DD04c17AFD5c9a8b3f2cdacaa8Ee7907385BEF
@@ -28,13 +21,15 @@ print("=" * 60)
 print("STEP-BY-STEP EXTRACTION:")
 print("=" * 60)
 
-# Test each pattern individually
-print(f"\n1. EVM Addresses found: {extract_evm_addresses(test_message)}")
-print(f"2. Trade type detected: {detect_trade_type(test_message)}")
-print(f"3. USD amounts: {extract_usd_amounts(test_message)}")
-print(f"4. Crypto amounts: {extract_crypto_amounts(test_message)}")
-print(f"5. Market cap: {extract_market_cap(test_message)}")
-print(f"6. URLs (non-DEX): {extract_urls(test_message)}")
+# One call runs every extractor (shared lowercase copy, fused scans)
+# instead of re-walking the message once per pattern
+extracted = parse_all(test_message)
+print(f"\n1. EVM Addresses found: {extracted['evm_addresses']}")
+print(f"2. Trade type detected: {extracted['trade_type']}")
+print(f"3. USD amounts: {extracted['usd_amounts']}")
+print(f"4. Crypto amounts: {extracted['crypto_amounts']}")
+print(f"5. Market cap: {extracted['market_cap']}")
+print(f"6. URLs (non-DEX): {extracted['urls']}")
 
 print()
 print("=" * 60)